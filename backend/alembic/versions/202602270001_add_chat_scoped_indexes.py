@@ -0,0 +1,111 @@
+"""Add composite indexes for chat-scoped history reads.
+
+Revision ID: 202602270001
+Revises: 202602260003
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270001"
+down_revision = "202602260003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_messages_chat_id_timestamp",
+        "messages",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_messages_chat_id_checkpoint_id",
+        "messages",
+        ["chat_id", "checkpoint_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_checkpoints_chat_id_timestamp",
+        "checkpoints",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_calls_chat_id_timestamp",
+        "tool_calls",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_file_edits_chat_id_timestamp",
+        "file_edits",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_file_snapshots_chat_id_timestamp",
+        "file_snapshots",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_reasoning_blocks_chat_id_timestamp",
+        "reasoning_blocks",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_context_items_chat_id",
+        "context_items",
+        ["chat_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_observations_chat_id_generation_timestamp",
+        "observations",
+        ["chat_id", "generation", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_memory_states_chat_id",
+        "memory_states",
+        ["chat_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_sub_agent_runs_chat_id_timestamp",
+        "sub_agent_runs",
+        ["chat_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_artifacts_chat_id_created_at",
+        "tool_artifacts",
+        ["chat_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_message_attachments_message_id_sort_order",
+        "message_attachments",
+        ["message_id", "sort_order"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_message_attachments_message_id_sort_order", table_name="message_attachments")
+    op.drop_index("ix_tool_artifacts_chat_id_created_at", table_name="tool_artifacts")
+    op.drop_index("ix_sub_agent_runs_chat_id_timestamp", table_name="sub_agent_runs")
+    op.drop_index("ix_memory_states_chat_id", table_name="memory_states")
+    op.drop_index("ix_observations_chat_id_generation_timestamp", table_name="observations")
+    op.drop_index("ix_context_items_chat_id", table_name="context_items")
+    op.drop_index("ix_reasoning_blocks_chat_id_timestamp", table_name="reasoning_blocks")
+    op.drop_index("ix_file_snapshots_chat_id_timestamp", table_name="file_snapshots")
+    op.drop_index("ix_file_edits_chat_id_timestamp", table_name="file_edits")
+    op.drop_index("ix_tool_calls_chat_id_timestamp", table_name="tool_calls")
+    op.drop_index("ix_checkpoints_chat_id_timestamp", table_name="checkpoints")
+    op.drop_index("ix_messages_chat_id_checkpoint_id", table_name="messages")
+    op.drop_index("ix_messages_chat_id_timestamp", table_name="messages")
@@ -0,0 +1,34 @@
+"""Normalize integer flag columns to 0/1 for Boolean mapping.
+
+Revision ID: 202602270002
+Revises: 202602270001
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270002"
+down_revision = "202602270001"
+branch_labels = None
+depends_on = None
+
+_FLAG_COLUMNS = (
+    ("chats", "is_pinned"),
+    ("auto_approve_rules", "enabled"),
+    ("mcp_servers", "enabled"),
+    ("mcp_tools_cache", "enabled"),
+)
+
+
+def upgrade() -> None:
+    # SQLite stores Boolean as INTEGER, so only out-of-range values need fixing.
+    for table, column in _FLAG_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = CASE WHEN {column} THEN 1 ELSE 0 END "
+            f"WHERE {column} NOT IN (0, 1)"
+        )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,28 @@
+"""Add chat list index matching the project sidebar ordering.
+
+Revision ID: 202602270003
+Revises: 202602270002
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "202602270003"
+down_revision = "202602270002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_chats_project_list",
+        "chats",
+        ["project_id", sa.text("is_pinned DESC"), "sort_order", sa.text("updated_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chats_project_list", table_name="chats")
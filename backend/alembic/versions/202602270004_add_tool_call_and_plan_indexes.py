@@ -0,0 +1,48 @@
+"""Add indexes for tool-call-scoped, plan and model-cache lookups.
+
+Revision ID: 202602270004
+Revises: 202602270003
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270004"
+down_revision = "202602270003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sub_agent_runs_tool_call_id",
+        "sub_agent_runs",
+        ["tool_call_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_artifacts_tool_call_id_created_at",
+        "tool_artifacts",
+        ["tool_call_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_plans_chat_id_updated_at",
+        "project_plans",
+        ["chat_id", "updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_provider_models_cache_provider",
+        "provider_models_cache",
+        ["provider"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_provider_models_cache_provider", table_name="provider_models_cache")
+    op.drop_index("ix_project_plans_chat_id_updated_at", table_name="project_plans")
+    op.drop_index("ix_tool_artifacts_tool_call_id_created_at", table_name="tool_artifacts")
+    op.drop_index("ix_sub_agent_runs_tool_call_id", table_name="sub_agent_runs")
@@ -0,0 +1,27 @@
+"""Add a tool_calls index for per-chat lookups filtered by tool name and status.
+
+Revision ID: 202602270005
+Revises: 202602270004
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270005"
+down_revision = "202602270004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tool_calls_chat_name_status_timestamp",
+        "tool_calls",
+        ["chat_id", "name", "status", "timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tool_calls_chat_name_status_timestamp", table_name="tool_calls")
@@ -0,0 +1,41 @@
+"""Add partial indexes over pending/running tool calls and sub-agent runs.
+
+Revision ID: 202602270006
+Revises: 202602270005
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "202602270006"
+down_revision = "202602270005"
+branch_labels = None
+depends_on = None
+
+_ACTIVE = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tool_calls_active",
+        "tool_calls",
+        ["chat_id", "timestamp"],
+        unique=False,
+        sqlite_where=sa.text(_ACTIVE),
+        postgresql_where=sa.text(_ACTIVE),
+    )
+    op.create_index(
+        "ix_sub_agent_runs_active",
+        "sub_agent_runs",
+        ["chat_id", "timestamp"],
+        unique=False,
+        sqlite_where=sa.text(_ACTIVE),
+        postgresql_where=sa.text(_ACTIVE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sub_agent_runs_active", table_name="sub_agent_runs")
+    op.drop_index("ix_tool_calls_active", table_name="tool_calls")
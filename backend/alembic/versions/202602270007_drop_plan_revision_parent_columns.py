@@ -0,0 +1,51 @@
+"""Drop chat_id/project_id from project_plan_revisions (always equal to the parent plan's).
+
+Revision ID: 202602270007
+Revises: 202602270006
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "202602270007"
+down_revision = "202602270006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("project_plan_revisions") as batch_op:
+        batch_op.drop_column("chat_id")
+        batch_op.drop_column("project_id")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("project_plan_revisions") as batch_op:
+        batch_op.add_column(sa.Column("chat_id", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("project_id", sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE project_plan_revisions
+        SET chat_id = (SELECT chat_id FROM project_plans WHERE project_plans.id = project_plan_revisions.plan_id),
+            project_id = (SELECT project_id FROM project_plans WHERE project_plans.id = project_plan_revisions.plan_id)
+        """
+    )
+    with op.batch_alter_table("project_plan_revisions") as batch_op:
+        batch_op.alter_column("chat_id", existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column("project_id", existing_type=sa.Text(), nullable=False)
+        batch_op.create_foreign_key(
+            "fk_project_plan_revisions_chat_id_chats",
+            "chats",
+            ["chat_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+        batch_op.create_foreign_key(
+            "fk_project_plan_revisions_project_id_projects",
+            "projects",
+            ["project_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
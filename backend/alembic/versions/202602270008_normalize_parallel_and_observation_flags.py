@@ -0,0 +1,32 @@
+"""Normalize tool_calls.parallel and settings.show_observations_in_chat to 0/1 for Boolean mapping.
+
+Revision ID: 202602270008
+Revises: 202602270007
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270008"
+down_revision = "202602270007"
+branch_labels = None
+depends_on = None
+
+_FLAG_COLUMNS = (
+    ("tool_calls", "parallel"),
+    ("settings", "show_observations_in_chat"),
+)
+
+
+def upgrade() -> None:
+    # Both columns are nullable; NULL (unknown) is kept as-is.
+    for table, column in _FLAG_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = CASE WHEN {column} THEN 1 ELSE 0 END "
+            f"WHERE {column} IS NOT NULL AND {column} NOT IN (0, 1)"
+        )
+
+
+def downgrade() -> None:
+    pass
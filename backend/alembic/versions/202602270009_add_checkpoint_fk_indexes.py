@@ -0,0 +1,39 @@
+"""Index checkpoint_id (and other SET NULL foreign keys) on child tables.
+
+Deleting checkpoints on revert fires ON DELETE SET NULL into every child table;
+without an index led by the child column SQLite scans each table per deleted row.
+
+Revision ID: 202602270009
+Revises: 202602270008
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270009"
+down_revision = "202602270008"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_messages_checkpoint_id", "messages", ["checkpoint_id"]),
+    ("ix_tool_calls_checkpoint_id", "tool_calls", ["checkpoint_id"]),
+    ("ix_file_edits_checkpoint_id", "file_edits", ["checkpoint_id"]),
+    ("ix_reasoning_blocks_checkpoint_id", "reasoning_blocks", ["checkpoint_id"]),
+    ("ix_file_snapshots_checkpoint_id", "file_snapshots", ["checkpoint_id"]),
+    ("ix_file_snapshots_file_edit_id", "file_snapshots", ["file_edit_id"]),
+    ("ix_project_plans_checkpoint_id", "project_plans", ["checkpoint_id"]),
+    ("ix_project_plan_revisions_checkpoint_id", "project_plan_revisions", ["checkpoint_id"]),
+    ("ix_checkpoints_message_id", "checkpoints", ["message_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
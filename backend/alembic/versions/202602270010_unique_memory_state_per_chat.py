@@ -0,0 +1,43 @@
+"""Make memory_states.chat_id unique so set_memory_state can upsert on it.
+
+Revision ID: 202602270010
+Revises: 202602270009
+Create Date: 2026-02-27
+
+"""
+
+from alembic import op
+
+revision = "202602270010"
+down_revision = "202602270009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The old select-then-insert could race and leave duplicates; keep the newest.
+    op.execute(
+        "DELETE FROM memory_states WHERE id NOT IN ("
+        "SELECT id FROM ("
+        "SELECT id, ROW_NUMBER() OVER ("
+        "PARTITION BY chat_id ORDER BY updated_at DESC, id DESC"
+        ") AS rn FROM memory_states"
+        ") AS ranked WHERE rn = 1)"
+    )
+    op.drop_index("ix_memory_states_chat_id", table_name="memory_states")
+    op.create_index(
+        "ix_memory_states_chat_id",
+        "memory_states",
+        ["chat_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_states_chat_id", table_name="memory_states")
+    op.create_index(
+        "ix_memory_states_chat_id",
+        "memory_states",
+        ["chat_id"],
+        unique=False,
+    )
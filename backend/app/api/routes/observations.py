@@ -51,13 +51,11 @@ def get_memory_state(chat_id: str, db: Session = Depends(get_db)):
         ]
         state = repo.get_memory_state(chat_id)
         if state is not None:
-            parsed_state: dict = {}
-            try:
-                raw = json.loads(state.state_json)
-                if isinstance(raw, dict):
-                    parsed_state = raw
-            except Exception:
-                parsed_state = {}
+            parsed_state: dict = (
+                state.state_json if isinstance(state.state_json, dict) else {}
+            )
+            # Always a JSON object string; undecodable legacy rows surface as "{}".
+            state_json_text = json.dumps(parsed_state, sort_keys=True)
 
             if state.strategy == "observational":
                 latest = repo.get_latest_observation(chat_id)
@@ -80,7 +78,7 @@ def get_memory_state(chat_id: str, db: Session = Depends(get_db)):
                 {
                     "hasMemoryState": True,
                     "strategy": state.strategy,
-                    "stateJson": state.state_json,
+                    "stateJson": state_json_text,
                     "state": parsed_state,
                     "observations": observation_rows,
                     "updatedAt": state.updated_at,
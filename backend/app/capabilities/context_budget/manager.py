@@ -25,6 +25,14 @@ def _stable_compaction_split_index(messages: list[dict], recent_count: int) -> i
     return split_idx
 
 
+def _content_preview(message: dict, limit: int = 500) -> str:
+    """Return message content capped at ``limit`` chars without copying short strings."""
+    content = message.get("content", "")
+    if not isinstance(content, str):
+        content = str(content)
+    return content if len(content) <= limit else content[:limit]
+
+
 @dataclass
 class ContextBudgetResult:
     messages: list[dict]
@@ -152,8 +160,10 @@ class ContextBudgetManager:
         model: str,
         context_limit: int,
         threshold_ratio: float,
+        tokens: int | None = None,
     ) -> tuple[list[dict], dict]:
-        tokens = count_messages_tokens(messages, model=model)
+        if tokens is None:
+            tokens = count_messages_tokens(messages, model=model)
         if tokens < int(context_limit * threshold_ratio):
             return messages, {"compaction_applied": False}
 
@@ -176,7 +186,7 @@ class ContextBudgetManager:
                             "Summarize the following conversation history concisely. "
                             "Preserve key decisions, file paths, and tool results.\n\n"
                             + "\n".join(
-                                f"[{m['role']}]: {str(m.get('content', ''))[:500]}"
+                                f"[{m['role']}]: {_content_preview(m)}"
                                 for m in old_messages
                             )
                         ),
@@ -251,11 +261,15 @@ class ContextBudgetManager:
                 model=model,
                 context_limit=context_limit,
                 threshold_ratio=0.95,
+                tokens=tokens_after_memory,
             )
             metadata.update(compact_meta)
 
-        # Final token pass.
-        estimated_tokens = count_messages_tokens(messages, model=model)
+        # Final token pass; messages are unchanged unless compaction ran.
+        if metadata.get("compaction_applied"):
+            estimated_tokens = count_messages_tokens(messages, model=model)
+        else:
+            estimated_tokens = tokens_after_memory
         metadata["estimated_tokens"] = estimated_tokens
         metadata["memory_mode"] = mem_cfg.mode
 
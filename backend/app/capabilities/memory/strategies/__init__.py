@@ -1,8 +1,16 @@
+from functools import cache
+
 from app.capabilities.memory.strategies.compact import CompactMemoryStrategy
-from app.capabilities.memory.strategies.observational import ObservationalMemoryStrategy
 
 
+@cache
 def get_memory_strategy(mode: str):
+    # Strategies are stateless; the observational one is imported lazily because it
+    # pulls in the OM service/background runner (ORM + threading) at import time.
     if mode == "observational":
+        from app.capabilities.memory.strategies.observational import (
+            ObservationalMemoryStrategy,
+        )
+
         return ObservationalMemoryStrategy()
     return CompactMemoryStrategy()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Literal, Protocol
+from typing import Any, Awaitable, Callable, Final, Literal, Protocol
 
 from app.capabilities.tools.types import ToolExecutionResult
 
 ApprovalPolicy = Literal["always", "rules", "manual"]
 
+# Shared input schema for tools that take no arguments. Kept a plain dict because
+# schemas are JSON-serialized into provider payloads; treat it as read-only.
+EMPTY_OBJECT_SCHEMA: Final[dict] = {"type": "object", "properties": {}}
+
 
 @dataclass
 class ToolExecutionContext:
@@ -23,7 +27,7 @@ class ToolHandler(Protocol):
         self,
         payload: dict,
         context: ToolExecutionContext,
-    ) -> Awaitable[ToolExecutionResult]: ...
+    ) -> Awaitable[ToolExecutionResult] | ToolExecutionResult: ...
 
 
 @dataclass
@@ -34,5 +38,8 @@ class ToolPlugin:
     description: str
     input_schema: dict
     approval_policy: ApprovalPolicy
-    handler: Callable[[dict, ToolExecutionContext], Awaitable[ToolExecutionResult]]
+    # Async for I/O-bound tools; tools that answer immediately may be plain functions.
+    handler: Callable[
+        [dict, ToolExecutionContext], Awaitable[ToolExecutionResult] | ToolExecutionResult
+    ]
     source: str = "builtin"
@@ -11,12 +11,19 @@ def load_builtin_tool_plugins() -> list[ToolPlugin]:
     import app.capabilities.tools.plugins as plugins_pkg
 
     out: list[ToolPlugin] = []
+    seen: dict[str, str] = {}
     for modinfo in pkgutil.iter_modules(plugins_pkg.__path__):
         if modinfo.name.startswith("_"):
             continue
         module = importlib.import_module(f"{plugins_pkg.__name__}.{modinfo.name}")
         plugin = getattr(module, "TOOL_PLUGIN", None)
         if isinstance(plugin, ToolPlugin):
+            if plugin.name in seen:
+                raise RuntimeError(
+                    f"Duplicate tool plugin name {plugin.name!r} in modules "
+                    f"{seen[plugin.name]!r} and {modinfo.name!r}"
+                )
+            seen[plugin.name] = modinfo.name
             out.append(plugin)
     out.sort(key=lambda p: p.name)
     return out
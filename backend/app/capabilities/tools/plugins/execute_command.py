@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import os
+import re
+import signal
+import subprocess
+import sys
 from pathlib import Path
 
 from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
@@ -25,7 +29,51 @@ _BLOCKED_PATTERNS = [
     "init 6",
 ]
 
+# One case-insensitive alternation scanned in a single pass; longest first so the
+# most specific pattern is reported when several overlap ("rm -rf /*" vs "rm -rf /").
+_BLOCKED_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(_BLOCKED_PATTERNS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
 _MAX_OUTPUT_BYTES = 100 * 1024  # 100KB
+_PIPE_LIMIT = 1 << 20
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_capped(stream: asyncio.StreamReader | None, cap: int) -> bytes:
+    """Drain a pipe to EOF, keeping only the first `cap` bytes.
+
+    Draining past the cap keeps the child from blocking on a full pipe while
+    bounding memory to what is actually returned.
+    """
+    if stream is None:
+        return b""
+    buf = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        if len(buf) < cap:
+            buf += chunk[: cap - len(buf)]
+    return bytes(buf)
+
+
+def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kill the shell and everything it spawned (its own process group on POSIX)."""
+    try:
+        if sys.platform == "win32":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _collect_output(proc: asyncio.subprocess.Process) -> tuple[bytes, bytes]:
+    stdout, stderr = await asyncio.gather(
+        _read_capped(proc.stdout, _MAX_OUTPUT_BYTES),
+        _read_capped(proc.stderr, _MAX_OUTPUT_BYTES),
+    )
+    await proc.wait()
+    return stdout, stderr
 
 
 async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutionResult:
@@ -44,16 +92,22 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
     elif context.project_root:
         cwd = str(Path(context.project_root).resolve())
 
-    cmd_lower = command.lower()
-    for pattern in _BLOCKED_PATTERNS:
-        if pattern in cmd_lower:
-            return ToolExecutionResult(
-                output=f"Blocked: command matches restricted pattern '{pattern}'",
-                file_edits=[],
-                ok=False,
-            )
+    blocked = _BLOCKED_RE.search(command)
+    if blocked:
+        return ToolExecutionResult(
+            output=f"Blocked: command matches restricted pattern '{blocked.group(0)}'",
+            file_edits=[],
+            ok=False,
+        )
 
     env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    # Run in a fresh process group/session so a timeout can reap child processes too.
+    group_kwargs: dict = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        if sys.platform == "win32"
+        else {"start_new_session": True}
+    )
+    proc: asyncio.subprocess.Process | None = None
     try:
         proc = await asyncio.create_subprocess_shell(
             command,
@@ -61,10 +115,18 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
             env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=_PIPE_LIMIT,
+            **group_kwargs,
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-    except asyncio.TimeoutError:
-        proc.kill()
+        async with asyncio.timeout(timeout):
+            stdout, stderr = await _collect_output(proc)
+    except TimeoutError:
+        if proc is not None:
+            _kill_process_tree(proc)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except TimeoutError:
+                pass
         return ToolExecutionResult(
             output=f"Command timed out after {timeout}s",
             file_edits=[],
@@ -73,16 +135,8 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
     except Exception as exc:
         return ToolExecutionResult(output=f"Command failed: {exc}", file_edits=[], ok=False)
 
-    out = (
-        (stdout or b"")[:_MAX_OUTPUT_BYTES]
-        .decode("utf-8", errors="replace")
-        .strip()
-    )
-    err = (
-        (stderr or b"")[:_MAX_OUTPUT_BYTES]
-        .decode("utf-8", errors="replace")
-        .strip()
-    )
+    out = stdout.decode("utf-8", errors="replace").strip()
+    err = stderr.decode("utf-8", errors="replace").strip()
     payload_out = out if out else ""
     if err:
         payload_out = f"{payload_out}\n{err}".strip()
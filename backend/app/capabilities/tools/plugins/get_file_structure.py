@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 
 from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
@@ -11,6 +12,18 @@ from app.tools.path_utils import resolve_path
 from app.utils.file_structure import get_file_structure
 
 
+@lru_cache(maxsize=512)
+def _structure_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Parse once per file version; mtime/size in the key invalidate stale entries."""
+    content = Path(path_str).read_text(encoding="utf-8")
+    return get_file_structure(content, path_str)
+
+
+def _read_structure(path: Path) -> str:
+    st = path.stat()
+    return _structure_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutionResult:
     """Return file structure (declarations with 1-based line ranges) for use with read_file spans."""
     try:
@@ -24,10 +37,6 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
     if not path.exists() or not path.is_file():
         return ToolExecutionResult(output=f"File not found: {path}", file_edits=[], ok=False)
 
-    def _read_structure(p: Path) -> str:
-        content = p.read_text(encoding="utf-8")
-        return get_file_structure(content, str(p))
-
     output = await asyncio.to_thread(_read_structure, path)
     return ToolExecutionResult(output=output, file_edits=[])
 
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib
+import os
+import queue
 import re
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +34,49 @@ def _load_pyripgrep_grep() -> type[Any] | None:
 
 PYRIPGREP_GREP = _load_pyripgrep_grep()
 
+# Idle `pyripgrep.Grep` instances. The binding makes no thread-safety promise, so
+# each search borrows its own; the pool never exceeds peak search concurrency.
+_GREP_POOL: queue.SimpleQueue[Any] = queue.SimpleQueue()
+
+
+@contextmanager
+def _borrow_grep() -> Generator[Any, None, None]:
+    if PYRIPGREP_GREP is None:
+        raise ImportError("pyripgrep is not installed")
+    try:
+        grep = _GREP_POOL.get_nowait()
+    except queue.Empty:
+        grep = PYRIPGREP_GREP()
+    try:
+        yield grep
+    finally:
+        _GREP_POOL.put(grep)
+
+
+# Dedicated pool so CPU-heavy searches do not contend with short blocking I/O
+# (file reads, DB work) on the default asyncio executor.
+_SEARCH_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 2),
+    thread_name_prefix="grep",
+)
+
+# Per-hit content width cap, mirroring ripgrep's `-M/--max-columns`.
+_DEFAULT_MAX_COLUMNS = 150
+
+# Patterns that match every line: guaranteed to dump (or time out on) the whole tree.
+_MATCH_ALL_PATTERNS = frozenset({".*", ".+", ".*?", ".+?", "^.*", "^.*$", "^"})
+
+# Two-stage search: regex metacharacters end the literal prefix used to prefilter
+# files; past this many candidate files a single full pass is cheaper.
+_REGEX_META_RE = re.compile(r"[.*+?|()\[\]{}^$\\]")
+_PREFILTER_MIN_LITERAL = 3
+_PREFILTER_MAX_FILES = 64
+
+# pyripgrep only skips these when a .gitignore says so; matches `/name/` with either separator.
+_IGNORED_DIR_RE = re.compile(
+    r"[/\\](?:" + "|".join(re.escape(name) for name in sorted(IGNORED_DIR_NAMES)) + r")[/\\]"
+)
+
 
 def _resolve_search_path(
     path_raw: str, project_root: str | None
@@ -50,85 +100,174 @@ def _resolve_search_path(
     return base, None
 
 
-def _format_grouped_text(output: str) -> str:
-    """Reformat `path:line:content` text into grouped output."""
-    if not output:
-        return output
-    grouped: dict[str, list[tuple[int, str]]] = {}
-    for line in output.split("\n"):
-        m = re.match(r"^(.+):(\d+):(.*)$", line)
-        if m:
-            path, num, content = m.group(1), int(m.group(2)), m.group(3)
-            grouped.setdefault(path, []).append((num, content.strip()))
+def _split_hit_line(line: str) -> tuple[str, int, str] | None:
+    """Split `path:line:content` at the first `:<digits>:`; None if not a hit line.
+
+    Scans left to right with `str.find` so colons in the matched content are kept
+    and drive-letter paths (`C:\\...`) are skipped past.
+    """
+    start = 0
+    while True:
+        first = line.find(":", start)
+        if first < 0:
+            return None
+        second = line.find(":", first + 1)
+        if second < 0:
+            return None
+        num = line[first + 1 : second]
+        if num.isdigit():
+            return line[:first], int(num), line[second + 1 :]
+        start = first + 1
+
+
+def _format_grouped_text(lines: Iterable[str], *, max_columns: int | None = None) -> str:
+    """Reformat `path:line:content` lines into grouped output.
+
+    Content longer than `max_columns` is cut (like `rg -M`) so minified/generated
+    lines do not flood the output.
+    """
+    grouped: defaultdict[str, list[str]] = defaultdict(list)
+    for line in lines:
+        hit = _split_hit_line(line)
+        if hit:
+            path, num, content = hit
+            content = content.strip()
+            if max_columns and len(content) > max_columns:
+                content = f"{content[:max_columns]} [... {len(content) - max_columns} more chars]"
+            grouped[path].append(f"  {num}: {content}")
     if not grouped:
         return "(no output)"
-    parts = []
-    for path, hits in grouped.items():
-        parts.append(f"{path}:")
-        for num, content in hits:
-            parts.append(f"  {num}: {content}")
-        parts.append("")
-    return "\n".join(parts).strip()
+    return "\n\n".join(f"{path}:\n" + "\n".join(hits) for path, hits in grouped.items())
+
+
+def _required_literal(pattern: str) -> str | None:
+    """Leading literal that every match of `pattern` must contain, if cheaply derivable.
+
+    Returns None for plain literals (a single pass is already optimal), for
+    alternations, and when the literal is too short to narrow the search.
+    """
+    if "|" in pattern:
+        return None
+    body = pattern.removeprefix("^")
+    meta = _REGEX_META_RE.search(body)
+    if meta is None:
+        return None
+    literal = body[: meta.start()]
+    if meta.group(0) in "*?{":
+        # The quantifier makes the preceding character optional.
+        literal = literal[:-1]
+    return literal if len(literal) >= _PREFILTER_MIN_LITERAL else None
+
+
+def _run_search(
+    grep: Any,
+    pattern: str,
+    *,
+    path: str,
+    output_mode: str,
+    case_insensitive: bool,
+    type_filter: str,
+) -> list[str]:
+    search_kwargs: dict[str, Any] = {
+        "path": path,
+        "output_mode": output_mode,
+        "n": True,
+        "i": case_insensitive,
+    }
+    if not type_filter:
+        return list(grep.search(pattern, **search_kwargs))
+    # Prefer ripgrep's built-in type table (covers multi-extension types such as
+    # `js` -> *.js/*.jsx/*.mjs); fall back to an extension glob for unknown names.
+    try:
+        return list(grep.search(pattern, type=type_filter, **search_kwargs))
+    except Exception as exc:
+        if "unknown file type" not in str(exc).lower():
+            raise
+    return list(grep.search(pattern, glob=f"*.{type_filter}", **search_kwargs))
 
 
 def _search_with_pyripgrep(payload: dict, pattern: str, base: Path) -> list[str]:
     """Execute search using ripgrep-python (pyripgrep) bindings."""
-    if PYRIPGREP_GREP is None:
-        raise ImportError("pyripgrep is not installed")
+    with _borrow_grep() as grep:
+        return _search_with_grep(grep, payload, pattern, base)
+
 
-    grep = PYRIPGREP_GREP()
-    glob = None
-    if type_filter := str(payload.get("type", "")).strip():
-        ext = type_filter.lstrip(".")
-        glob = f"*.{ext}"
+def _search_with_grep(grep: Any, payload: dict, pattern: str, base: Path) -> list[str]:
+    """Run the search on a borrowed Grep instance.
 
+    For regex patterns with a usable literal prefix, first lists files containing
+    that literal and then runs the full regex only on those files.
+    """
     output_mode = "files_with_matches" if payload.get("files_only") else "content"
+    case_insensitive = bool(payload.get("case_insensitive"))
+    type_filter = str(payload.get("type", "")).strip().lstrip(".")
 
-    return list(
-        grep.search(
-            pattern,
+    literal = _required_literal(pattern) if base.is_dir() else None
+    if literal is not None:
+        candidates = _run_search(
+            grep,
+            literal,
             path=str(base),
-            glob=glob,
-            output_mode=output_mode,
-            n=True,
-            i=bool(payload.get("case_insensitive")),
+            output_mode="files_with_matches",
+            case_insensitive=case_insensitive,
+            type_filter=type_filter,
         )
+        if len(candidates) <= _PREFILTER_MAX_FILES:
+            results: list[str] = []
+            for candidate in candidates:
+                # Candidates already passed the type filter; explicit files need none.
+                results.extend(
+                    grep.search(
+                        pattern,
+                        path=candidate,
+                        output_mode=output_mode,
+                        n=True,
+                        i=case_insensitive,
+                    )
+                )
+            return results
+
+    return _run_search(
+        grep,
+        pattern,
+        path=str(base),
+        output_mode=output_mode,
+        case_insensitive=case_insensitive,
+        type_filter=type_filter,
     )
 
 
+def _max_columns(payload: dict) -> int | None:
+    """Resolve the content width cap; 0 disables it."""
+    try:
+        value = int(payload.get("max_columns", _DEFAULT_MAX_COLUMNS))
+    except (TypeError, ValueError):
+        return _DEFAULT_MAX_COLUMNS
+    return value if value > 0 else None
+
+
 def _filter_ignored_paths(lines: list[str]) -> list[str]:
     """Filter out ignored directory matches from returned lines/paths."""
-    cleaned: list[str] = []
-    ignored_markers = tuple(f"\\{name}\\" for name in IGNORED_DIR_NAMES) + tuple(
-        f"/{name}/" for name in IGNORED_DIR_NAMES
-    )
-    for line in lines:
-        text = line.replace("/", "\\")
-        if any(marker in text for marker in ignored_markers):
-            continue
-        cleaned.append(line)
-    return cleaned
+    return [line for line in lines if not _IGNORED_DIR_RE.search(line)]
 
 
-def _interpret_pyripgrep_result(lines: list[str], *, files_only: bool = False) -> str:
+def _interpret_pyripgrep_result(
+    lines: list[str],
+    *,
+    files_only: bool = False,
+    max_columns: int | None = _DEFAULT_MAX_COLUMNS,
+) -> str:
     """Normalize ripgrep-python output into grep tool output format."""
     if not lines:
         return "No matches found"
 
     if files_only:
-        seen: set[str] = set()
-        out: list[str] = []
-        for line in lines:
-            m = re.match(r"^(.+?):\d+:", line)
-            path = m.group(1) if m else line
-            if path not in seen:
-                seen.add(path)
-                out.append(path)
-        return "\n".join(out) if out else "No matches found"
-
-    joined = "\n".join(lines)
-    if re.search(r"^.+:\d+:", joined, flags=re.MULTILINE):
-        return _format_grouped_text(joined)
+        # `files_with_matches` mode already yields one unique path per line.
+        return "\n".join(lines)
+
+    first = next((line for line in lines if line), "")
+    if _split_hit_line(first) is not None:
+        return _format_grouped_text(lines, max_columns=max_columns)
     return "\n".join(lines)
 
 
@@ -136,6 +275,15 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
     pattern = str(payload.get("pattern", "")).strip()
     if not pattern:
         return ToolExecutionResult(output="Missing pattern", file_edits=[], ok=False)
+    if pattern in _MATCH_ALL_PATTERNS:
+        return ToolExecutionResult(
+            output=(
+                f"Pattern {pattern!r} matches every line. Use a more specific pattern, "
+                "or list_files / read_file to inspect files."
+            ),
+            file_edits=[],
+            ok=False,
+        )
 
     base, err = _resolve_search_path(payload.get("path") or "", context.project_root)
     if err or base is None:
@@ -145,13 +293,17 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
 
     try:
         lines = await asyncio.wait_for(
-            asyncio.to_thread(_search_with_pyripgrep, payload, pattern, base),
+            asyncio.get_running_loop().run_in_executor(
+                _SEARCH_POOL,
+                functools.partial(_search_with_pyripgrep, payload, pattern, base),
+            ),
             timeout=60,
         )
         lines = _filter_ignored_paths(lines)
         output = _interpret_pyripgrep_result(
             lines,
             files_only=bool(payload.get("files_only", False)),
+            max_columns=_max_columns(payload),
         )
         return ToolExecutionResult(output=output, file_edits=[])
     except ImportError:
@@ -195,13 +347,18 @@ TOOL_PLUGIN = ToolPlugin(
             },
             "type": {
                 "type": "string",
-                "description": "File type filter (e.g. py, ts, js)",
+                "description": "File type filter: ripgrep type name or extension (e.g. py, ts, js)",
             },
             "files_only": {
                 "type": "boolean",
                 "description": "Only return matching file paths",
                 "default": False,
             },
+            "max_columns": {
+                "type": "integer",
+                "description": "Truncate matched lines longer than this many characters (0 = no limit)",
+                "default": _DEFAULT_MAX_COLUMNS,
+            },
         },
     },
     approval_policy="rules",
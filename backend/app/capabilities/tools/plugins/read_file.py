@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
 from pathlib import Path
 
 from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
@@ -20,22 +20,73 @@ EXT_TO_MIME: dict[str, str] = {
 }
 
 
-def _read_span_streaming(path: Path, start_idx: int, end_idx: int) -> str:
-    """Stream lines and collect only the requested span; stop after end_idx to save I/O."""
-    span_lines: list[str] = []
-    total = 0
-    with path.open(encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            line_num = i + 1
-            total = line_num
-            if line_num > end_idx:
-                break
-            if line_num >= start_idx:
-                span_lines.append(line.rstrip("\n"))
-    total_str = f"lines {start_idx}-{end_idx}" if total > end_idx else f"{total} lines"
+_READ_CHUNK_SIZE = 64 * 1024
+# Multiple of 3 so per-chunk base64 output concatenates without padding.
+_IMAGE_CHUNK_SIZE = 57 * 1024
+
+
+def _skip_newlines(chunk: bytes, pos: int, count: int) -> int:
+    """Return the offset just past the `count`-th newline at or after `pos`."""
+    for _ in range(count):
+        pos = chunk.index(b"\n", pos) + 1
+    return pos
+
+
+def _read_span_streaming(path: Path, start_idx: int, end_idx: int | None) -> str:
+    """Collect only the requested span; stop after end_idx (None = EOF) to save I/O.
+
+    Reads binary chunks and locates line boundaries with `bytes.count`/`index`, so
+    bytes before the span are never decoded and only the span itself is.
+    """
+    span = bytearray()
+    newlines = 0
+    has_more = False
+    ends_with_newline = True
+    with path.open("rb") as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            ends_with_newline = chunk.endswith(b"\n")
+            pos = 0
+            if newlines < start_idx - 1:
+                needed = start_idx - 1 - newlines
+                found = chunk.count(b"\n")
+                if found < needed:
+                    newlines += found
+                    continue
+                pos = _skip_newlines(chunk, 0, needed)
+                newlines += needed
+            found = chunk.count(b"\n", pos)
+            if end_idx is None or found < end_idx - newlines:
+                span += chunk[pos:]
+                newlines += found
+                continue
+            remaining = end_idx - newlines
+            cut = _skip_newlines(chunk, pos, remaining)
+            span += chunk[pos:cut]
+            newlines += remaining
+            has_more = cut < len(chunk) or bool(f.read(1))
+            break
+
+    span_lines = span.decode("utf-8", errors="replace").split("\n")
+    if span_lines and span_lines[-1] == "":
+        span_lines.pop()
+    span_lines = [line[:-1] if line.endswith("\r") else line for line in span_lines]
+    if has_more:
+        total_str = f"lines {start_idx}-{end_idx}"
+    else:
+        total_str = f"{newlines + (0 if ends_with_newline else 1)} lines"
     return f"File: {path} ({total_str})\n\n" + "\n".join(span_lines)
 
 
+def _read_image_base64(path: Path) -> str:
+    """Return a data URL, base64-encoding the image in chunks to bound peak memory."""
+    encoded = bytearray()
+    with path.open("rb") as f:
+        while chunk := f.read(_IMAGE_CHUNK_SIZE):
+            encoded += binascii.b2a_base64(chunk, newline=False)
+    mime = EXT_TO_MIME.get(path.suffix.lower(), "image/png")
+    return f"data:{mime};base64,{encoded.decode('ascii')}"
+
+
 async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutionResult:
     try:
         path = resolve_path(
@@ -50,11 +101,6 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
 
     if path.suffix.lower() in IMAGE_EXTENSIONS:
         if context.model_has_vision:
-            def _read_image_base64(p: Path) -> str:
-                data = p.read_bytes()
-                b64 = base64.b64encode(data).decode("ascii")
-                mime = EXT_TO_MIME.get(p.suffix.lower(), "image/png")
-                return f"data:{mime};base64,{b64}"
             data_url = await asyncio.to_thread(_read_image_base64, path)
             return ToolExecutionResult(
                 output=f"Image: {path}\n\n{data_url}",
@@ -73,12 +119,9 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
     end_val = payload.get("end")
     has_span = start_val is not None and end_val is not None
 
-    if is_mention_ref and not has_span:
-        lines = path.read_text(encoding="utf-8").splitlines()
-        total = len(lines)
-        if total > 0:
-            output = await asyncio.to_thread(_read_span_streaming, path, 1, total)
-            return ToolExecutionResult(output=output, file_edits=[])
+    if is_mention_ref and not has_span and path.stat().st_size > 0:
+        output = await asyncio.to_thread(_read_span_streaming, path, 1, None)
+        return ToolExecutionResult(output=output, file_edits=[])
 
     if not has_span:
         return ToolExecutionResult(
@@ -79,7 +79,7 @@ async def _handler(payload: dict, context: ToolExecutionContext) -> ToolExecutio
 
     project_repo = ProjectRepository(chat_repo.db)
     api_key_resolver = APIKeyResolver(settings_repo)
-    default_prompt = settings_svc.get_system_prompt()
+    default_prompt = settings_svc.get_sub_agent_system_prompt()
 
     runner = SubAgentRunner(
         chat_repo=chat_repo,
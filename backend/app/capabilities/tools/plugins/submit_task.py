@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
+from app.capabilities.tools.interfaces import (
+    EMPTY_OBJECT_SCHEMA,
+    ToolExecutionContext,
+    ToolPlugin,
+)
 from app.capabilities.tools.types import ToolExecutionResult
 
 
 async def _handler(_payload: dict, context: ToolExecutionContext) -> ToolExecutionResult:
     if context.chat_id and context.chat_repo:
-        todos = context.chat_repo.get_current_todos(context.chat_id)
-        incomplete = [t for t in todos if (t.get("status") or "").lower() != "completed"]
-        if incomplete:
+        if context.chat_repo.count_incomplete_todos(context.chat_id):
             return ToolExecutionResult(
                 output=(
                     "Todo list has incomplete items. Verify everything is done, use update_todo_list "
@@ -27,7 +29,7 @@ TOOL_PLUGIN = ToolPlugin(
         "Signal that you have completed all tasks. Call this once your work is done "
         "to end the agent loop. The loop continues until you call this tool."
     ),
-    input_schema={"type": "object", "properties": {}},
+    input_schema=EMPTY_OBJECT_SCHEMA,
     approval_policy="always",
     handler=_handler,
 )
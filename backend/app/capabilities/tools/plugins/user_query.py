@@ -6,10 +6,11 @@ from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
 from app.capabilities.tools.types import ToolExecutionResult
 
 USER_QUERY_SUCCESS_OUTPUT = "Awaiting user response."
+USER_QUERY_RESULT = ToolExecutionResult(output=USER_QUERY_SUCCESS_OUTPUT, ok=True)
 
 
-async def _handler(_payload: dict, _context: ToolExecutionContext) -> ToolExecutionResult:
-    return ToolExecutionResult(output=USER_QUERY_SUCCESS_OUTPUT, ok=True)
+def _handler(_payload: dict, _context: ToolExecutionContext) -> ToolExecutionResult:
+    return USER_QUERY_RESULT
 
 
 TOOL_PLUGIN = ToolPlugin(
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from app.tools.contracts import ToolFileEdit
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolArtifact:
     artifact_type: str
     file_path: str
@@ -13,13 +14,16 @@ class ToolArtifact:
     preview_lines: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolExecutionResult:
-    """Canonical tool execution result for capability plugins."""
+    """Canonical tool execution result for capability plugins.
+
+    Immutable so constant results can be shared as module-level singletons.
+    """
 
     output: str
     output_preview: str | None = None
-    artifacts: list[ToolArtifact] = field(default_factory=list)
-    file_edits: list[ToolFileEdit] = field(default_factory=list)
+    artifacts: Sequence[ToolArtifact] = ()
+    file_edits: Sequence[ToolFileEdit] = ()
     ok: bool = True
     error: str | None = None
@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.config.defaults import (
@@ -11,7 +9,11 @@ from app.config.defaults import (
 
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_default=False,
+        frozen=True,
     )
 
     app_env: str = "dev"
@@ -19,23 +21,41 @@ class AppSettings(BaseSettings):
     database_url: str = "sqlite:///./agentic.db"
     openrouter_api_key: str = ""
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
-    fallback_models: list[str] = FALLBACK_MODELS
+    fallback_models: tuple[str, ...] = FALLBACK_MODELS
     default_active_model: str = DEFAULT_ACTIVE_MODEL
     default_context_limit: int = DEFAULT_CONTEXT_LIMIT
-    cors_origins: list[str] = [
+    cors_origins: tuple[str, ...] = (
         "http://localhost:5173",
         "http://127.0.0.1:5173",
         "http://localhost:4173",
         "http://127.0.0.1:4173",
-    ]
+    )
     oauth_redirect_base: str = "http://localhost:8000"
     oauth_redirect_uri: str = "http://localhost:1455/auth/callback"  # Codex OAuth app allows this; proxy on 1455 forwards to main app
     frontend_base: str = "http://localhost:5173"
-    fs_allowed_roots: list[str] = []
+    fs_allowed_roots: tuple[str, ...] = ()
     max_agent_iterations: int = 50
     max_parallel_tool_calls: int = 8
+    # Sized for the sync-endpoint threadpool plus background runners sharing the engine.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    # Debug/CI guard: any relationship lazy load that would emit SQL raises instead.
+    orm_raise_on_lazy_load: bool = False
+
+
+_settings: AppSettings | None = None
 
 
-@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
-    return AppSettings()
+    # Plain global rather than lru_cache: settings are read on most requests and
+    # the frozen instance is safe to share.
+    global _settings
+    if _settings is None:
+        _settings = AppSettings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Drop the cached settings so the next get_settings() re-reads the environment."""
+    global _settings
+    _settings = None
@@ -1,22 +1,41 @@
 from __future__ import annotations
 
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from app.mcp.client_manager import MCPClientManager
+    from app.services.agent_task_manager import AgentTaskManager
+    from app.services.approval_waiter import ApprovalWaiter
+    from app.services.event_bus import EventBus
+    from app.services.memory.observational.background import OMBackgroundRunner
+    from app.tools.registry import ToolRegistry
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AppContainer:
-    """App-scoped runtime container."""
+    """App-scoped runtime container.
+
+    Immutable: swap a service by installing a ``dataclasses.replace`` copy via
+    ``set_container``.
+    """
 
-    event_bus: Any
-    tool_registry: Any
-    om_runner: Any
-    approval_waiter: Any
-    agent_task_manager: Any
-    mcp_client_manager: Any
+    event_bus: EventBus
+    tool_registry: ToolRegistry
+    om_runner: OMBackgroundRunner
+    approval_waiter: ApprovalWaiter
+    agent_task_manager: AgentTaskManager
+    mcp_client_manager: MCPClientManager
 
 
+# Process-wide container installed by the app lifespan. Request tasks and worker
+# threads do not inherit the lifespan task's context, so this stays the fallback.
 _container: AppContainer | None = None
+# Scoped overrides; visible to the current task and anything it spawns.
+_container_var: ContextVar[AppContainer | None] = ContextVar("scythe_container", default=None)
 
 
 def set_container(container: AppContainer | None) -> None:
@@ -25,4 +44,14 @@ def set_container(container: AppContainer | None) -> None:
 
 
 def get_container() -> AppContainer | None:
-    return _container
+    return _container_var.get() or _container
+
+
+@contextmanager
+def override_container(container: AppContainer) -> Generator[AppContainer, None, None]:
+    """Use `container` for the current context (and tasks spawned from it)."""
+    token = _container_var.set(container)
+    try:
+        yield container
+    finally:
+        _container_var.reset(token)
@@ -1,15 +1,16 @@
-from sqlalchemy import Integer, Text
+from sqlalchemy import Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 
 class AutoApproveRule(Base):
     __tablename__ = "auto_approve_rules"
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
-    field: Mapped[str] = mapped_column(Text, nullable=False)
+    field: Mapped[str] = mapped_column(InternedText, nullable=False)
     value: Mapped[str] = mapped_column(Text, nullable=False)
-    enabled: Mapped[int] = mapped_column(Integer, nullable=False)
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False)
     created_at: Mapped[str] = mapped_column(Text, nullable=False)
 
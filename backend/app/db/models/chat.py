@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -23,6 +23,17 @@ if TYPE_CHECKING:
 
 class Chat(Base):
     __tablename__ = "chats"
+    # Matches list_chats_for_project's filter and ORDER BY, so the sidebar list
+    # is read in index order without a sort step.
+    __table_args__ = (
+        Index(
+            "ix_chats_project_list",
+            "project_id",
+            text("is_pinned DESC"),
+            "sort_order",
+            text("updated_at DESC"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -30,37 +41,66 @@ class Chat(Base):
     created_at: Mapped[str] = mapped_column(Text, nullable=False)
     updated_at: Mapped[str] = mapped_column(Text, nullable=False)
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    is_pinned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    is_pinned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     project: Mapped["Project"] = relationship(back_populates="chats")
+    # History collections are read through ChatRepository queries, never via these
+    # attributes; "raise" keeps an accidental per-chat lazy load (N+1) from slipping in.
     messages: Mapped[list["Message"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     checkpoints: Mapped[list["Checkpoint"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     tool_calls: Mapped[list["ToolCall"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     sub_agent_runs: Mapped[list["SubAgentRun"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     file_edits: Mapped[list["FileEdit"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     reasoning_blocks: Mapped[list["ReasoningBlock"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        viewonly=True,
+        lazy="raise",
     )
     context_items: Mapped[list["ContextItem"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     file_snapshots: Mapped[list["FileSnapshot"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        viewonly=True,
+        lazy="raise",
     )
     observations: Mapped[list["Observation"]] = relationship(
-        "Observation", cascade="all, delete-orphan", passive_deletes=True,
+        "Observation",
         foreign_keys="Observation.chat_id",
+        viewonly=True,
+        lazy="raise",
     )
     project_plans: Mapped[list["ProjectPlan"]] = relationship(
-        back_populates="chat", cascade="all, delete-orphan", passive_deletes=True
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
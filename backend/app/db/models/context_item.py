@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 if TYPE_CHECKING:
     from app.db.models.chat import Chat
@@ -13,10 +14,11 @@ if TYPE_CHECKING:
 
 class ContextItem(Base):
     __tablename__ = "context_items"
+    __table_args__ = (Index("ix_context_items_chat_id", "chat_id"),)
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
-    type: Mapped[str] = mapped_column(Text, nullable=False)
+    type: Mapped[str] = mapped_column(InternedText, nullable=False)
     label: Mapped[str] = mapped_column(Text, nullable=False)
     tokens: Mapped[int] = mapped_column(Integer, nullable=False)
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 if TYPE_CHECKING:
     from app.db.models.chat import Chat
@@ -13,12 +14,16 @@ if TYPE_CHECKING:
 
 class FileEdit(Base):
     __tablename__ = "file_edits"
+    __table_args__ = (
+        Index("ix_file_edits_chat_id_timestamp", "chat_id", "timestamp"),
+        Index("ix_file_edits_checkpoint_id", "checkpoint_id"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
     checkpoint_id: Mapped[Optional[str]] = mapped_column(ForeignKey("checkpoints.id", ondelete="SET NULL"), nullable=True)
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
-    action: Mapped[str] = mapped_column(Text, nullable=False)
+    action: Mapped[str] = mapped_column(InternedText, nullable=False)
     diff: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     timestamp: Mapped[str] = mapped_column(Text, nullable=False)
 
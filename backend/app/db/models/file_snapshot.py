@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -13,6 +13,11 @@ if TYPE_CHECKING:
 
 class FileSnapshot(Base):
     __tablename__ = "file_snapshots"
+    __table_args__ = (
+        Index("ix_file_snapshots_chat_id_timestamp", "chat_id", "timestamp"),
+        Index("ix_file_snapshots_checkpoint_id", "checkpoint_id"),
+        Index("ix_file_snapshots_file_edit_id", "file_edit_id"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(
@@ -1,9 +1,10 @@
 from typing import Optional
 
-from sqlalchemy import Integer, Text
+from sqlalchemy import Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 
 class MCPServer(Base):
@@ -11,8 +12,8 @@ class MCPServer(Base):
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     name: Mapped[str] = mapped_column(Text, nullable=False)
-    transport: Mapped[str] = mapped_column(Text, nullable=False)
+    transport: Mapped[str] = mapped_column(InternedText, nullable=False)
     config_json: Mapped[str] = mapped_column(Text, nullable=False)
-    enabled: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     last_connected_at: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import Boolean, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONText
 
 
 class MCPToolCache(Base):
@@ -12,8 +13,8 @@ class MCPToolCache(Base):
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     server_id: Mapped[str] = mapped_column(ForeignKey("mcp_servers.id", ondelete="CASCADE"), nullable=False)
     tool_name: Mapped[str] = mapped_column(Text, nullable=False)
-    schema_json: Mapped[str] = mapped_column(Text, nullable=False)
+    schema_json: Mapped[dict[str, Any]] = mapped_column(JSONText, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     discovered_at: Mapped[str] = mapped_column(Text, nullable=False)
-    enabled: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Text
+from typing import Any
+
+from sqlalchemy import ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONText
 
 
 class MemoryState(Base):
     __tablename__ = "memory_states"
+    # One state row per chat; set_memory_state upserts on this key.
+    __table_args__ = (Index("ix_memory_states_chat_id", "chat_id", unique=True),)
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
     strategy: Mapped[str] = mapped_column(Text, nullable=False)
-    state_json: Mapped[str] = mapped_column(Text, nullable=False)
+    state_json: Mapped[dict[str, Any]] = mapped_column(JSONText, nullable=False)
     updated_at: Mapped[str] = mapped_column(Text, nullable=False)
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -8,6 +8,14 @@ from app.db.base import Base
 
 class Observation(Base):
     __tablename__ = "observations"
+    __table_args__ = (
+        Index(
+            "ix_observations_chat_id_generation_timestamp",
+            "chat_id",
+            "generation",
+            "timestamp",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     chat_id: Mapped[str] = mapped_column(
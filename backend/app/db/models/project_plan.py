@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 class ProjectPlan(Base):
     __tablename__ = "project_plans"
+    __table_args__ = (
+        Index("ix_project_plans_chat_id_updated_at", "chat_id", "updated_at"),
+        Index("ix_project_plans_checkpoint_id", "checkpoint_id"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(
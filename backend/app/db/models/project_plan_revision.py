@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,18 +12,20 @@ if TYPE_CHECKING:
 
 
 class ProjectPlanRevision(Base):
+    """Snapshot of a plan's mutable fields at one revision; chat/project come from `plan`."""
+
     __tablename__ = "project_plan_revisions"
+    __table_args__ = (
+        # Created by migration 202602230005; declared here so create_all matches.
+        Index("ix_project_plan_revisions_plan_revision", "plan_id", "revision", unique=True),
+        Index("ix_project_plan_revisions_plan_created", "plan_id", "created_at"),
+        Index("ix_project_plan_revisions_checkpoint_id", "checkpoint_id"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     plan_id: Mapped[str] = mapped_column(
         ForeignKey("project_plans.id", ondelete="CASCADE"), nullable=False
     )
-    chat_id: Mapped[str] = mapped_column(
-        ForeignKey("chats.id", ondelete="CASCADE"), nullable=False
-    )
-    project_id: Mapped[str] = mapped_column(
-        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
-    )
     checkpoint_id: Mapped[Optional[str]] = mapped_column(
         ForeignKey("checkpoints.id", ondelete="SET NULL"), nullable=True
     )
@@ -31,7 +33,8 @@ class ProjectPlanRevision(Base):
     title: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[str] = mapped_column(Text, nullable=False)
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
-    content_markdown: Mapped[str] = mapped_column(Text, nullable=False)
+    # Full plan body per revision; only read when restoring one, never when listing.
+    content_markdown: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
     content_sha256: Mapped[str] = mapped_column(Text, nullable=False)
     last_editor: Mapped[str] = mapped_column(Text, nullable=False)
     approved_action: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
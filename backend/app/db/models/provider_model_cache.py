@@ -1,17 +1,19 @@
-from typing import Optional
-from sqlalchemy import Integer, Text
+from typing import Any, Optional
+from sqlalchemy import Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONText
 
 
 class ProviderModelCache(Base):
     __tablename__ = "provider_models_cache"
+    __table_args__ = (Index("ix_provider_models_cache_provider", "provider"),)
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     provider: Mapped[str] = mapped_column(Text, nullable=False)
     label: Mapped[str] = mapped_column(Text, nullable=False)
     context_limit: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    raw_json: Mapped[str] = mapped_column(Text, nullable=False)
+    raw_json: Mapped[dict[str, Any]] = mapped_column(JSONText, nullable=False)
     fetched_at: Mapped[str] = mapped_column(Text, nullable=False)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 class ReasoningBlock(Base):
     __tablename__ = "reasoning_blocks"
+    __table_args__ = (
+        Index("ix_reasoning_blocks_chat_id_timestamp", "chat_id", "timestamp"),
+        Index("ix_reasoning_blocks_checkpoint_id", "checkpoint_id"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
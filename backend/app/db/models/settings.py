@@ -1,5 +1,4 @@
-from sqlalchemy import Integer, Text
-from typing import Optional
+from sqlalchemy import Boolean, Integer, Text
 from typing import Optional
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,7 +19,9 @@ class Settings(Base):
     brave_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     openai_sub_access_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     openai_sub_refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
-    system_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Custom prompts can be several KB and are only read when a run starts; keep
+    # them out of the settings row fetched on most requests.
+    system_prompt: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     reasoning_level: Mapped[str | None] = mapped_column(
         Text, nullable=True, default="medium"
     )
@@ -31,7 +32,7 @@ class Settings(Base):
     observer_threshold: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=30000)
     buffer_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=6000)
     reflector_threshold: Mapped[int | None] = mapped_column(Integer, nullable=True, default=8000)
-    show_observations_in_chat: Mapped[int | None] = mapped_column(Integer, nullable=True, default=0)
+    show_observations_in_chat: Mapped[bool | None] = mapped_column(Boolean, nullable=True, default=False)
     tool_output_token_threshold: Mapped[int | None] = mapped_column(Integer, nullable=True)
     tool_output_preview_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     sub_agent_model: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.models.tool_call import ACTIVE_STATUS_SQL
 
 if TYPE_CHECKING:
     from app.db.models.chat import Chat
@@ -18,6 +19,17 @@ class SubAgentRun(Base):
     """Represents a single sub-agent execution spawned by spawn_sub_agent."""
 
     __tablename__ = "sub_agent_runs"
+    __table_args__ = (
+        Index("ix_sub_agent_runs_chat_id_timestamp", "chat_id", "timestamp"),
+        Index("ix_sub_agent_runs_tool_call_id", "tool_call_id"),
+        Index(
+            "ix_sub_agent_runs_active",
+            "chat_id",
+            "timestamp",
+            sqlite_where=text(ACTIVE_STATUS_SQL),
+            postgresql_where=text(ACTIVE_STATUS_SQL),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 
 class ToolArtifact(Base):
     __tablename__ = "tool_artifacts"
+    __table_args__ = (
+        Index("ix_tool_artifacts_chat_id_created_at", "chat_id", "created_at"),
+        Index("ix_tool_artifacts_tool_call_id_created_at", "tool_call_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     tool_call_id: Mapped[str] = mapped_column(ForeignKey("tool_calls.id", ondelete="CASCADE"), nullable=False)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
     project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    artifact_type: Mapped[str] = mapped_column(Text, nullable=False)
+    artifact_type: Mapped[str] = mapped_column(InternedText, nullable=False)
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
     line_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     preview_lines: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
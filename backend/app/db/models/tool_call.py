@@ -2,29 +2,48 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import InternedText
 
 if TYPE_CHECKING:
     from app.db.models.chat import Chat
     from app.db.models.sub_agent_run import SubAgentRun
 
 
+# Pending/running rows are a small, hot subset. Queries must repeat this exact
+# literal predicate (not bound parameters) for SQLite to pick the partial indexes.
+ACTIVE_STATUS_SQL = "status IN ('pending', 'running')"
+
+
 class ToolCall(Base):
     __tablename__ = "tool_calls"
+    __table_args__ = (
+        Index("ix_tool_calls_chat_id_timestamp", "chat_id", "timestamp"),
+        Index("ix_tool_calls_checkpoint_id", "checkpoint_id"),
+        # Latest completed call of a given tool (todo list state) is an index seek.
+        Index("ix_tool_calls_chat_name_status_timestamp", "chat_id", "name", "status", "timestamp"),
+        Index(
+            "ix_tool_calls_active",
+            "chat_id",
+            "timestamp",
+            sqlite_where=text(ACTIVE_STATUS_SQL),
+            postgresql_where=text(ACTIVE_STATUS_SQL),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(Text, primary_key=True)
     chat_id: Mapped[str] = mapped_column(ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
     checkpoint_id: Mapped[Optional[str]] = mapped_column(ForeignKey("checkpoints.id", ondelete="SET NULL"), nullable=True)
-    name: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[str] = mapped_column(Text, nullable=False)
+    name: Mapped[str] = mapped_column(InternedText, nullable=False)
+    status: Mapped[str] = mapped_column(InternedText, nullable=False)
     input_json: Mapped[str] = mapped_column(Text, nullable=False)
     output_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     timestamp: Mapped[str] = mapped_column(Text, nullable=False)
     duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    parallel: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    parallel: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     parallel_group: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     chat: Mapped["Chat"] = relationship(back_populates="tool_calls")
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 
@@ -16,3 +21,15 @@ class BaseRepository:
 
     def rollback(self) -> None:
         self.db.rollback()
+
+    def bulk_insert(
+        self, model: type, rows: Iterable[dict[str, Any]], *, page_size: int = 1000
+    ) -> None:
+        """Insert plain row dicts with executemany (batched into multi-VALUES
+        statements), skipping per-object unit-of-work bookkeeping.
+
+        Rows must share the same keys; no ORM instances are created or returned.
+        """
+        it = iter(rows)
+        while chunk := list(islice(it, page_size)):
+            self.db.execute(insert(model), chunk)
@@ -1,10 +1,14 @@
-import json
 from datetime import datetime
+from functools import lru_cache
+from collections.abc import Iterator, Sequence
 from typing import Any, cast
 
 from sqlalchemy import and_, delete, or_
-from sqlalchemy import select
+from sqlalchemy import Row, Select, bindparam, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import undefer
 
 from app.db.models.chat import Chat
 from app.db.models.checkpoint import Checkpoint
@@ -19,17 +23,22 @@ from app.db.models.project_plan import ProjectPlan
 from app.db.models.project_plan_revision import ProjectPlanRevision
 from app.db.models.reasoning_block import ReasoningBlock
 from app.db.models.tool_artifact import ToolArtifact
-from app.db.models.tool_call import ToolCall
+from app.db.models.tool_call import ACTIVE_STATUS_SQL, ToolCall
 from app.db.models.sub_agent_run import SubAgentRun
 from app.db.repositories.base_repo import BaseRepository
+from app.services.token_counter import count_text_tokens
 from app.utils.ids import generate_id
 from app.utils.json_helpers import safe_parse_json
 from app.utils.time import utc_now_iso
 from app.utils.todos import normalize_todo_items
 
 
+@lru_cache(maxsize=1024)
 def _normalize_ts(iso_str: str) -> str:
     """Ensure ISO timestamp has consistent microsecond padding for string comparison."""
+    # utc_now_iso already writes this exact shape; only legacy rows need the parse.
+    if len(iso_str) == 32 and iso_str[19] == "." and iso_str.endswith("+00:00"):
+        return iso_str
     dt = datetime.fromisoformat(iso_str)
     return dt.strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
 
@@ -37,11 +46,143 @@ def _normalize_ts(iso_str: str) -> str:
 def _parse_ts_safe(iso_str: str) -> datetime | None:
     """Parse ISO timestamp; return None if invalid."""
     try:
-        return datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        # 3.11+ fromisoformat accepts a "Z" suffix directly (and is C-implemented;
+        # hand-slicing the canonical shape measured ~6x slower).
+        return datetime.fromisoformat(iso_str)
     except (ValueError, TypeError):
         return None
 
 
+def _after_checkpoint(model: Any, cutoff: str, checkpoint_id: str) -> Any:
+    """Rows strictly after the cutoff, or at it but not belonging to `checkpoint_id`."""
+    return or_(
+        model.timestamp > cutoff,
+        and_(
+            model.timestamp == cutoff,
+            or_(model.checkpoint_id.is_(None), model.checkpoint_id != checkpoint_id),
+        ),
+    )
+
+
+def _chat_scoped(model: Any, *order_by: Any) -> Select:
+    return select(model).where(model.chat_id == bindparam("chat_id")).order_by(*order_by)
+
+
+# For revert-time bulk deletes whose callers re-query afterwards: skips the
+# identity-map scan (or PK pre-fetch for subquery criteria) of synchronize_session.
+_NO_SESSION_SYNC = {"synchronize_session": False}
+
+# For iter_* readers: fetch in windows so a long chat's rows (tool output, message
+# bodies) are never all buffered at once.
+_STREAM_ROWS = {"yield_per": 500}
+
+# Per-chat reads run on every agent turn; building them once skips clause
+# construction and cache-key generation on each call. Execute with {"chat_id": ...}.
+_LIST_MESSAGES = _chat_scoped(Message, Message.timestamp.asc())
+_LIST_TOOL_CALLS = _chat_scoped(ToolCall, ToolCall.timestamp.asc())
+_LIST_SUB_AGENT_RUNS = _chat_scoped(SubAgentRun, SubAgentRun.timestamp.asc())
+_LIST_FILE_EDITS = _chat_scoped(FileEdit, FileEdit.timestamp.asc())
+_LIST_CHECKPOINTS = _chat_scoped(Checkpoint, Checkpoint.timestamp.asc())
+_LIST_REASONING_BLOCKS = _chat_scoped(ReasoningBlock, ReasoningBlock.timestamp.asc())
+_LIST_CONTEXT_ITEMS = _chat_scoped(ContextItem, ContextItem.id.asc())
+_LIST_TOOL_ARTIFACTS = _chat_scoped(ToolArtifact, ToolArtifact.created_at.asc())
+_LIST_OBSERVATIONS = _chat_scoped(
+    Observation, Observation.generation.desc(), Observation.timestamp.desc()
+)
+_LATEST_OBSERVATION = _LIST_OBSERVATIONS.limit(1)
+# Revert trim only needs these to decide which observations survive.
+_LIST_OBSERVATION_KEYS = _LIST_OBSERVATIONS.with_only_columns(
+    Observation.id, Observation.timestamp, Observation.observed_up_to_message_id
+)
+_GET_MEMORY_STATE = _chat_scoped(MemoryState)
+
+# Column-only variants for read paths that just serialize: Core rows skip ORM
+# instance construction and identity-map bookkeeping. Attribute names match the model.
+_LIST_MESSAGE_ROWS = _LIST_MESSAGES.with_only_columns(
+    Message.id,
+    Message.role,
+    Message.content,
+    Message.timestamp,
+    Message.checkpoint_id,
+    Message.image_summarization,
+    Message.image_summarization_model,
+)
+_LIST_TOOL_CALL_ROWS = _LIST_TOOL_CALLS.with_only_columns(
+    ToolCall.id,
+    ToolCall.checkpoint_id,
+    ToolCall.name,
+    ToolCall.status,
+    ToolCall.input_json,
+    ToolCall.output_text,
+    ToolCall.timestamp,
+    ToolCall.duration_ms,
+    ToolCall.parallel,
+    ToolCall.parallel_group,
+)
+_LIST_FILE_EDIT_ROWS = _LIST_FILE_EDITS.with_only_columns(
+    FileEdit.id,
+    FileEdit.checkpoint_id,
+    FileEdit.file_path,
+    FileEdit.action,
+    FileEdit.diff,
+    FileEdit.timestamp,
+)
+_LIST_REASONING_BLOCK_ROWS = _LIST_REASONING_BLOCKS.with_only_columns(
+    ReasoningBlock.id,
+    ReasoningBlock.checkpoint_id,
+    ReasoningBlock.content,
+    ReasoningBlock.timestamp,
+    ReasoningBlock.duration_ms,
+)
+_LIST_PROJECT_PLANS = _chat_scoped(ProjectPlan, ProjectPlan.updated_at.asc())
+_LIST_ACTIVE_TOOL_CALLS = _chat_scoped(ToolCall, ToolCall.timestamp.asc()).where(
+    text(ACTIVE_STATUS_SQL)
+)
+_LIST_ACTIVE_SUB_AGENT_RUNS = _chat_scoped(SubAgentRun, SubAgentRun.timestamp.asc()).where(
+    text(ACTIVE_STATUS_SQL)
+)
+_LATEST_TODO_CALL = (
+    select(ToolCall.id, ToolCall.input_json, ToolCall.timestamp)
+    .where(
+        ToolCall.chat_id == bindparam("chat_id"),
+        ToolCall.name == "update_todo_list",
+        ToolCall.status == "completed",
+    )
+    .order_by(ToolCall.timestamp.desc())
+    .limit(1)
+)
+_LATEST_TODO_INPUT = _LATEST_TODO_CALL.with_only_columns(ToolCall.input_json)
+_LIST_ATTACHMENTS_FOR_CHAT = (
+    select(MessageAttachment)
+    .join(Message, Message.id == MessageAttachment.message_id)
+    .where(Message.chat_id == bindparam("chat_id"))
+    .order_by(MessageAttachment.message_id, MessageAttachment.sort_order.asc())
+)
+
+# Lookups keyed by a parent row other than the chat; bind the named parameter.
+_LIST_SUB_AGENT_RUNS_FOR_TOOL_CALL = (
+    select(SubAgentRun)
+    .where(SubAgentRun.tool_call_id == bindparam("tool_call_id"))
+    .order_by(SubAgentRun.timestamp.asc())
+)
+_LIST_TOOL_ARTIFACTS_FOR_TOOL_CALL = (
+    select(ToolArtifact)
+    .where(ToolArtifact.tool_call_id == bindparam("tool_call_id"))
+    .order_by(ToolArtifact.created_at.asc())
+)
+_LIST_ATTACHMENTS_FOR_MESSAGE = (
+    select(MessageAttachment)
+    .where(MessageAttachment.message_id == bindparam("message_id"))
+    .order_by(MessageAttachment.sort_order.asc())
+)
+_GET_CHECKPOINT_BY_MESSAGE = select(Checkpoint).where(
+    Checkpoint.message_id == bindparam("message_id")
+)
+_GET_FILE_SNAPSHOT_BY_EDIT = select(FileSnapshot).where(
+    FileSnapshot.file_edit_id == bindparam("file_edit_id")
+)
+
+
 class ChatRepository(BaseRepository):
     _UNSET = object()
 
@@ -69,38 +210,54 @@ class ChatRepository(BaseRepository):
         return self.db.get(ProjectPlanRevision, revision_id)
 
     def list_messages(self, chat_id: str) -> list[Message]:
-        stmt = (
-            select(Message)
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.timestamp.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.scalars(_LIST_MESSAGES, {"chat_id": chat_id}).all())
+
+    def has_messages(self, chat_id: str) -> bool:
+        stmt = select(Message.id).where(Message.chat_id == chat_id).limit(1)
+        return self.db.scalars(stmt).first() is not None
 
     def list_tool_calls(self, chat_id: str) -> list[ToolCall]:
-        stmt = (
-            select(ToolCall)
-            .where(ToolCall.chat_id == chat_id)
-            .order_by(ToolCall.timestamp.asc())
+        return list(self.db.scalars(_LIST_TOOL_CALLS, {"chat_id": chat_id}).all())
+
+    def list_message_rows(self, chat_id: str) -> Sequence[Row]:
+        """Read-only message rows for serialization; use list_messages to mutate."""
+        return self.db.execute(_LIST_MESSAGE_ROWS, {"chat_id": chat_id}).all()
+
+    def list_tool_call_rows(self, chat_id: str) -> Sequence[Row]:
+        """Read-only tool call rows for serialization; use list_tool_calls to mutate."""
+        return self.db.execute(_LIST_TOOL_CALL_ROWS, {"chat_id": chat_id}).all()
+
+    def iter_message_rows(self, chat_id: str) -> Iterator[Row]:
+        """Stream list_message_rows; consume fully before issuing other queries."""
+        yield from self.db.execute(
+            _LIST_MESSAGE_ROWS, {"chat_id": chat_id}, execution_options=_STREAM_ROWS
         )
-        return list(self.db.scalars(stmt).all())
 
-    def list_sub_agent_runs(self, chat_id: str) -> list[SubAgentRun]:
-        stmt = (
-            select(SubAgentRun)
-            .where(SubAgentRun.chat_id == chat_id)
-            .order_by(SubAgentRun.timestamp.asc())
+    def iter_tool_call_rows(self, chat_id: str) -> Iterator[Row]:
+        """Stream list_tool_call_rows; consume fully before issuing other queries."""
+        yield from self.db.execute(
+            _LIST_TOOL_CALL_ROWS, {"chat_id": chat_id}, execution_options=_STREAM_ROWS
         )
-        return list(self.db.scalars(stmt).all())
+
+    def list_active_tool_calls(self, chat_id: str) -> list[ToolCall]:
+        """Pending/running tool calls only, served by the ix_tool_calls_active partial index."""
+        return list(self.db.scalars(_LIST_ACTIVE_TOOL_CALLS, {"chat_id": chat_id}).all())
+
+    def list_sub_agent_runs(self, chat_id: str) -> list[SubAgentRun]:
+        return list(self.db.scalars(_LIST_SUB_AGENT_RUNS, {"chat_id": chat_id}).all())
+
+    def list_active_sub_agent_runs(self, chat_id: str) -> list[SubAgentRun]:
+        """Pending/running sub-agent runs only, served by the ix_sub_agent_runs_active partial index."""
+        return list(self.db.scalars(_LIST_ACTIVE_SUB_AGENT_RUNS, {"chat_id": chat_id}).all())
 
     def list_sub_agent_runs_for_tool_call(
         self, tool_call_id: str
     ) -> list[SubAgentRun]:
-        stmt = (
-            select(SubAgentRun)
-            .where(SubAgentRun.tool_call_id == tool_call_id)
-            .order_by(SubAgentRun.timestamp.asc())
+        return list(
+            self.db.scalars(
+                _LIST_SUB_AGENT_RUNS_FOR_TOOL_CALL, {"tool_call_id": tool_call_id}
+            ).all()
         )
-        return list(self.db.scalars(stmt).all())
 
     def get_sub_agent_run(self, sub_agent_id: str) -> SubAgentRun | None:
         return self.db.get(SubAgentRun, sub_agent_id)
@@ -148,12 +305,11 @@ class ChatRepository(BaseRepository):
         return sub_agent_run
 
     def list_file_edits(self, chat_id: str) -> list[FileEdit]:
-        stmt = (
-            select(FileEdit)
-            .where(FileEdit.chat_id == chat_id)
-            .order_by(FileEdit.timestamp.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.scalars(_LIST_FILE_EDITS, {"chat_id": chat_id}).all())
+
+    def list_file_edit_rows(self, chat_id: str) -> Sequence[Row]:
+        """Read-only file edit rows for serialization; use list_file_edits to mutate."""
+        return self.db.execute(_LIST_FILE_EDIT_ROWS, {"chat_id": chat_id}).all()
 
     def list_file_edits_for_checkpoint(
         self, chat_id: str, checkpoint_id: str
@@ -169,29 +325,24 @@ class ChatRepository(BaseRepository):
         return list(self.db.scalars(stmt).all())
 
     def list_checkpoints(self, chat_id: str) -> list[Checkpoint]:
-        stmt = (
-            select(Checkpoint)
-            .where(Checkpoint.chat_id == chat_id)
-            .order_by(Checkpoint.timestamp.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.scalars(_LIST_CHECKPOINTS, {"chat_id": chat_id}).all())
 
     def list_reasoning_blocks(self, chat_id: str) -> list[ReasoningBlock]:
-        stmt = (
-            select(ReasoningBlock)
-            .where(ReasoningBlock.chat_id == chat_id)
-            .order_by(ReasoningBlock.timestamp.asc())
+        return list(self.db.scalars(_LIST_REASONING_BLOCKS, {"chat_id": chat_id}).all())
+
+    def list_reasoning_block_rows(self, chat_id: str) -> Sequence[Row]:
+        """Read-only reasoning block rows for serialization; use list_reasoning_blocks to mutate."""
+        return self.db.execute(_LIST_REASONING_BLOCK_ROWS, {"chat_id": chat_id}).all()
+
+    def iter_reasoning_block_rows(self, chat_id: str) -> Iterator[Row]:
+        """Stream list_reasoning_block_rows; consume fully before issuing other queries."""
+        yield from self.db.execute(
+            _LIST_REASONING_BLOCK_ROWS, {"chat_id": chat_id}, execution_options=_STREAM_ROWS
         )
-        return list(self.db.scalars(stmt).all())
 
     def list_project_plans(self, chat_id: str) -> list[ProjectPlan]:
-        stmt = (
-            select(ProjectPlan)
-            .where(ProjectPlan.chat_id == chat_id)
-            .order_by(ProjectPlan.updated_at.asc())
-        )
         try:
-            return list(self.db.scalars(stmt).all())
+            return list(self.db.scalars(_LIST_PROJECT_PLANS, {"chat_id": chat_id}).all())
         except OperationalError as exc:
             # Older local DBs may not have the project_plans table yet.
             if "no such table: project_plans" in str(exc).lower():
@@ -250,6 +401,19 @@ class ChatRepository(BaseRepository):
                 return []
             raise
 
+    def has_project_plan_revisions(self, plan_id: str) -> bool:
+        try:
+            stmt = (
+                select(ProjectPlanRevision.id)
+                .where(ProjectPlanRevision.plan_id == plan_id)
+                .limit(1)
+            )
+            return self.db.scalars(stmt).first() is not None
+        except OperationalError as exc:
+            if "no such table: project_plan_revisions" in str(exc).lower():
+                return False
+            raise
+
     def get_latest_project_plan_revision_at_or_before(
         self, plan_id: str, cutoff_timestamp: str, checkpoint_id: str
     ) -> ProjectPlanRevision | None:
@@ -257,6 +421,7 @@ class ChatRepository(BaseRepository):
         try:
             stmt = (
                 select(ProjectPlanRevision)
+                .options(undefer(ProjectPlanRevision.content_markdown))
                 .where(
                     ProjectPlanRevision.plan_id == plan_id,
                     or_(
@@ -305,25 +470,11 @@ class ChatRepository(BaseRepository):
             raise
 
     def list_context_items(self, chat_id: str) -> list[ContextItem]:
-        stmt = (
-            select(ContextItem)
-            .where(ContextItem.chat_id == chat_id)
-            .order_by(ContextItem.id.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.scalars(_LIST_CONTEXT_ITEMS, {"chat_id": chat_id}).all())
 
     def get_current_todos(self, chat_id: str) -> list[dict]:
         """Return the active todo state derived from the latest successful update_todo_list call."""
-        latest_stmt = (
-            select(ToolCall)
-            .where(
-                ToolCall.chat_id == chat_id,
-                ToolCall.name == "update_todo_list",
-                ToolCall.status == "completed",
-            )
-            .order_by(ToolCall.timestamp.desc())
-        )
-        latest = self.db.scalars(latest_stmt).first()
+        latest = self.db.execute(_LATEST_TODO_CALL, {"chat_id": chat_id}).first()
         if latest is None:
             return []
 
@@ -341,21 +492,37 @@ class ChatRepository(BaseRepository):
             for idx, item in enumerate(normalized)
         ]
 
+    def count_incomplete_todos(self, chat_id: str) -> int:
+        """Count non-completed items in the current todo list.
+
+        Loads only the latest update_todo_list payload column instead of the full
+        ToolCall row and skips building the todo dicts.
+        """
+        input_json = self.db.scalars(_LATEST_TODO_INPUT, {"chat_id": chat_id}).first()
+        if input_json is None:
+            return 0
+        payload = safe_parse_json(input_json)
+        items = payload.get("todos") if isinstance(payload, dict) else []
+        return sum(1 for item in normalize_todo_items(items) if item["status"] != "completed")
+
     def replace_context_items(
         self, chat_id: str, items: list[tuple[str, str, str, int]]
     ) -> None:
         """Replace all context items with (id, type, label, tokens) tuples."""
         self.db.execute(delete(ContextItem).where(ContextItem.chat_id == chat_id))
-        for item_id, item_type, label, tokens in items:
-            self.db.add(
-                ContextItem(
-                    id=item_id,
-                    chat_id=chat_id,
-                    type=item_type,
-                    label=label,
-                    tokens=tokens,
-                )
-            )
+        self.bulk_insert(
+            ContextItem,
+            (
+                {
+                    "id": item_id,
+                    "chat_id": chat_id,
+                    "type": item_type,
+                    "label": label,
+                    "tokens": tokens,
+                }
+                for item_id, item_type, label, tokens in items
+            ),
+        )
 
     def create_message(
         self,
@@ -407,12 +574,16 @@ class ChatRepository(BaseRepository):
             msg.image_summarization_model = model
 
     def list_attachments_for_message(self, message_id: str) -> list[MessageAttachment]:
-        stmt = (
-            select(MessageAttachment)
-            .where(MessageAttachment.message_id == message_id)
-            .order_by(MessageAttachment.sort_order.asc())
+        return list(
+            self.db.scalars(_LIST_ATTACHMENTS_FOR_MESSAGE, {"message_id": message_id}).all()
         )
-        return list(self.db.scalars(stmt).all())
+
+    def list_attachments_for_chat(self, chat_id: str) -> dict[str, list[MessageAttachment]]:
+        """All attachments in a chat grouped by message id, each group in sort order."""
+        by_message: dict[str, list[MessageAttachment]] = {}
+        for attachment in self.db.scalars(_LIST_ATTACHMENTS_FOR_CHAT, {"chat_id": chat_id}):
+            by_message.setdefault(attachment.message_id, []).append(attachment)
+        return by_message
 
     def delete_attachments_for_message(self, message_id: str) -> None:
         self.db.execute(delete(MessageAttachment).where(MessageAttachment.message_id == message_id))
@@ -460,7 +631,7 @@ class ChatRepository(BaseRepository):
             output_text=output_text,
             timestamp=timestamp,
             duration_ms=duration_ms,
-            parallel=1 if parallel_group else 0,
+            parallel=bool(parallel_group),
             parallel_group=parallel_group,
         )
         self.db.add(tool_call)
@@ -576,8 +747,6 @@ class ChatRepository(BaseRepository):
         *,
         revision_id: str,
         plan_id: str,
-        chat_id: str,
-        project_id: str,
         checkpoint_id: str | None,
         revision: int,
         title: str,
@@ -593,8 +762,6 @@ class ChatRepository(BaseRepository):
         row = ProjectPlanRevision(
             id=revision_id,
             plan_id=plan_id,
-            chat_id=chat_id,
-            project_id=project_id,
             checkpoint_id=checkpoint_id,
             revision=revision,
             title=title,
@@ -648,8 +815,7 @@ class ChatRepository(BaseRepository):
         return plan
 
     def get_checkpoint_by_message(self, message_id: str) -> Checkpoint | None:
-        stmt = select(Checkpoint).where(Checkpoint.message_id == message_id)
-        return self.db.scalars(stmt).first()
+        return self.db.scalars(_GET_CHECKPOINT_BY_MESSAGE, {"message_id": message_id}).first()
 
     def create_file_snapshot(
         self,
@@ -675,45 +841,30 @@ class ChatRepository(BaseRepository):
         return snapshot
 
     def get_file_snapshot_by_edit(self, file_edit_id: str) -> FileSnapshot | None:
-        stmt = select(FileSnapshot).where(FileSnapshot.file_edit_id == file_edit_id)
-        return self.db.scalars(stmt).first()
+        return self.db.scalars(
+            _GET_FILE_SNAPSHOT_BY_EDIT, {"file_edit_id": file_edit_id}
+        ).first()
 
-    def list_file_snapshots_after_checkpoint(
+    def take_file_snapshots_after_checkpoint(
         self, chat_id: str, cutoff_ts: str, checkpoint_id: str
-    ) -> list[FileSnapshot]:
+    ) -> list[Row]:
+        """Delete snapshots recorded after the checkpoint and return them, newest first.
+
+        One DELETE ... RETURNING replaces a list-then-delete pair. Rows carry
+        file_path, content and timestamp only.
+        """
         cutoff = _normalize_ts(cutoff_ts)
-        stmt = (
-            select(FileSnapshot)
+        rows = self.db.execute(
+            delete(FileSnapshot)
             .where(
                 FileSnapshot.chat_id == chat_id,
-                or_(
-                    FileSnapshot.timestamp > cutoff,
-                    and_(
-                        FileSnapshot.timestamp == cutoff,
-                        or_(FileSnapshot.checkpoint_id.is_(None), FileSnapshot.checkpoint_id != checkpoint_id),
-                    ),
-                ),
+                _after_checkpoint(FileSnapshot, cutoff, checkpoint_id),
             )
-            .order_by(FileSnapshot.timestamp.desc())
-        )
-        return list(self.db.scalars(stmt).all())
-
-    def delete_file_snapshots_after_checkpoint(
-        self, chat_id: str, cutoff_ts: str, checkpoint_id: str
-    ) -> None:
-        cutoff = _normalize_ts(cutoff_ts)
-        self.db.execute(
-            delete(FileSnapshot).where(
-                FileSnapshot.chat_id == chat_id,
-                or_(
-                    FileSnapshot.timestamp > cutoff,
-                    and_(
-                        FileSnapshot.timestamp == cutoff,
-                        or_(FileSnapshot.checkpoint_id.is_(None), FileSnapshot.checkpoint_id != checkpoint_id),
-                    ),
-                ),
-            )
-        )
+            .returning(FileSnapshot.file_path, FileSnapshot.content, FileSnapshot.timestamp),
+            execution_options=_NO_SESSION_SYNC,
+        ).all()
+        # RETURNING has no ORDER BY; restore order matters when a file was edited twice.
+        return sorted(rows, key=lambda row: row.timestamp, reverse=True)
 
     def delete_file_snapshot(self, snapshot: FileSnapshot) -> None:
         self.db.delete(snapshot)
@@ -726,13 +877,7 @@ class ChatRepository(BaseRepository):
             select(ToolCall)
             .where(
                 ToolCall.chat_id == chat_id,
-                or_(
-                    ToolCall.timestamp > cutoff,
-                    and_(
-                        ToolCall.timestamp == cutoff,
-                        or_(ToolCall.checkpoint_id.is_(None), ToolCall.checkpoint_id != checkpoint_id),
-                    ),
-                ),
+                _after_checkpoint(ToolCall, cutoff, checkpoint_id),
             )
         )
         return list(self.db.scalars(stmt).all())
@@ -771,66 +916,61 @@ class ChatRepository(BaseRepository):
         return artifact
 
     def list_tool_artifacts_for_tool_call(self, tool_call_id: str) -> list[ToolArtifact]:
-        stmt = (
-            select(ToolArtifact)
-            .where(ToolArtifact.tool_call_id == tool_call_id)
-            .order_by(ToolArtifact.created_at.asc())
+        return list(
+            self.db.scalars(
+                _LIST_TOOL_ARTIFACTS_FOR_TOOL_CALL, {"tool_call_id": tool_call_id}
+            ).all()
         )
-        return list(self.db.scalars(stmt).all())
 
     def list_tool_artifacts_for_chat(self, chat_id: str) -> list[ToolArtifact]:
-        stmt = (
-            select(ToolArtifact)
-            .where(ToolArtifact.chat_id == chat_id)
-            .order_by(ToolArtifact.created_at.asc())
-        )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.scalars(_LIST_TOOL_ARTIFACTS, {"chat_id": chat_id}).all())
 
     def set_memory_state(
         self,
         *,
         chat_id: str,
         strategy: str,
-        state_json: str,
+        state_json: dict[str, Any],
         updated_at: str,
     ) -> MemoryState:
-        stmt = select(MemoryState).where(MemoryState.chat_id == chat_id)
-        existing = self.db.scalars(stmt).first()
-        if existing is None:
-            existing = MemoryState(
-                id=generate_id("mem"),
-                chat_id=chat_id,
-                strategy=strategy,
-                state_json=state_json,
-                updated_at=updated_at,
-            )
-            self.db.add(existing)
-        else:
-            existing.strategy = strategy
-            existing.state_json = state_json
-            existing.updated_at = updated_at
-        return existing
+        """Insert or update the chat's state row in one statement.
+
+        populate_existing refreshes an instance already loaded in this session.
+        """
+        insert_ = (
+            postgresql_insert
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        stmt = insert_(MemoryState).values(
+            id=generate_id("mem"),
+            chat_id=chat_id,
+            strategy=strategy,
+            state_json=state_json,
+            updated_at=updated_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MemoryState.chat_id],
+            set_={
+                "strategy": stmt.excluded.strategy,
+                "state_json": stmt.excluded.state_json,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(MemoryState)
+        return self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
     def get_memory_state(self, chat_id: str) -> MemoryState | None:
-        stmt = select(MemoryState).where(MemoryState.chat_id == chat_id)
-        return self.db.scalars(stmt).first()
+        return self.db.scalars(_GET_MEMORY_STATE, {"chat_id": chat_id}).first()
 
     def get_latest_observation(self, chat_id: str) -> Observation | None:
         """Return the highest-generation, most-recent observation for a chat."""
-        stmt = (
-            select(Observation)
-            .where(Observation.chat_id == chat_id)
-            .order_by(Observation.generation.desc(), Observation.timestamp.desc())
-        )
-        return self.db.scalars(stmt).first()
+        return self.db.scalars(_LATEST_OBSERVATION, {"chat_id": chat_id}).first()
 
     def list_observations(self, chat_id: str) -> list[Observation]:
-        stmt = (
-            select(Observation)
-            .where(Observation.chat_id == chat_id)
-            .order_by(Observation.generation.desc(), Observation.timestamp.desc())
-        )
-        return list(self.db.scalars(stmt).all())
+        """List observations newest first."""
+        return list(self.db.scalars(_LIST_OBSERVATIONS, {"chat_id": chat_id}).all())
 
     def create_observation(
         self,
@@ -904,11 +1044,49 @@ class ChatRepository(BaseRepository):
             self.db.execute(delete(MemoryState).where(MemoryState.chat_id == chat_id))
             return
 
-        valid_message_ids = {m.id for m in self.list_messages(chat_id)}
+        observations = self.db.execute(_LIST_OBSERVATION_KEYS, {"chat_id": chat_id}).all()
+        state_row = self.get_memory_state(chat_id)
+        is_observational = state_row is not None and state_row.strategy == "observational"
+        parsed_state: dict[str, Any] = (
+            state_row.state_json
+            if is_observational and isinstance(state_row.state_json, dict)
+            else {}
+        )
+
+        # Safely get 'buffer' and ensure it's a dictionary
+        buffer_data = parsed_state.get("buffer")
+        raw_buffer: dict[str, Any] = buffer_data if isinstance(buffer_data, dict) else {}
+
+        # Safely get 'chunks' from raw_buffer and ensure it's a list
+        chunks_data = raw_buffer.get("chunks")
+        raw_chunks: list[dict[str, Any]] = chunks_data if isinstance(chunks_data, list) else []
+
+        # Check only the message ids memory points at, not every message in the chat.
+        referenced_message_ids = {
+            obs.observed_up_to_message_id
+            for obs in observations
+            if obs.observed_up_to_message_id
+        }
+        referenced_message_ids.update(
+            chunk["observedUpToMessageId"]
+            for chunk in raw_chunks
+            if isinstance(chunk, dict) and isinstance(chunk.get("observedUpToMessageId"), str)
+        )
+        valid_message_ids: set[str] = (
+            set(
+                self.db.scalars(
+                    select(Message.id).where(
+                        Message.chat_id == chat_id,
+                        Message.id.in_(referenced_message_ids),
+                    )
+                )
+            )
+            if referenced_message_ids
+            else set()
+        )
 
-        observations = self.list_observations(chat_id)
         observation_ids_to_delete: list[str] = []
-        valid_observations: list[Observation] = []
+        latest_observation_id: str | None = None
         for obs in observations:
             obs_dt = _parse_ts_safe(obs.timestamp)
             if obs_dt is None or obs_dt > cutoff_dt:
@@ -917,7 +1095,8 @@ class ChatRepository(BaseRepository):
             if obs.observed_up_to_message_id and obs.observed_up_to_message_id not in valid_message_ids:
                 observation_ids_to_delete.append(obs.id)
                 continue
-            valid_observations.append(obs)
+            if latest_observation_id is None:
+                latest_observation_id = obs.id
 
         if observation_ids_to_delete:
             self.db.execute(
@@ -927,27 +1106,12 @@ class ChatRepository(BaseRepository):
                 )
             )
 
-        latest_observation = valid_observations[0] if valid_observations else None
-        state_row = self.get_memory_state(chat_id)
-        if state_row is None or state_row.strategy != "observational":
+        if not is_observational:
             return
+        latest_observation = (
+            self.db.get(Observation, latest_observation_id) if latest_observation_id else None
+        )
 
-        parsed_state: dict[str, Any] = {}
-        if isinstance(state_row.state_json, str):
-            try:
-                raw_state = json.loads(state_row.state_json)
-                if isinstance(raw_state, dict):
-                    parsed_state = raw_state
-            except Exception:
-                parsed_state = {}
-
-        # Safely get 'buffer' and ensure it's a dictionary
-        buffer_data = parsed_state.get("buffer")
-        raw_buffer: dict[str, Any] = buffer_data if isinstance(buffer_data, dict) else {}
-
-        # Safely get 'chunks' from raw_buffer and ensure it's a list
-        chunks_data = raw_buffer.get("chunks")
-        raw_chunks: list[dict[str, Any]] = chunks_data if isinstance(chunks_data, list) else []
         valid_chunks: list[dict[str, Any]] = []
         for raw_chunk in raw_chunks:
             if not isinstance(raw_chunk, dict):
@@ -975,12 +1139,7 @@ class ChatRepository(BaseRepository):
             if isinstance(token_count, int) and token_count > 0:
                 normalized_token_count = token_count
             else:
-                try:
-                    import tiktoken
-                    _enc = tiktoken.get_encoding("cl100k_base")
-                    normalized_token_count = len(_enc.encode(content.strip())) or 1
-                except Exception:
-                    normalized_token_count = max(1, len(content.strip()) // 4)
+                normalized_token_count = count_text_tokens(content.strip()) or 1
 
             current_task = raw_chunk.get("currentTask")
             suggested_response = raw_chunk.get("suggestedResponse")
@@ -1067,74 +1226,61 @@ class ChatRepository(BaseRepository):
         self.set_memory_state(
             chat_id=chat_id,
             strategy="observational",
-            state_json=json.dumps(next_state),
+            state_json=next_state,
             updated_at=utc_now_iso(),
         )
 
     def delete_after_checkpoint(
         self, *, chat_id: str, cutoff_timestamp: str, checkpoint_id: str
     ) -> None:
+        """Bulk-delete chat history recorded after the checkpoint.
+
+        Deletes skip identity-map synchronization: instances of the removed rows
+        already loaded in this session must not be used afterwards.
+        """
         cutoff = _normalize_ts(cutoff_timestamp)
         # Delete records that are strictly after the cutoff, OR have the same
         # timestamp but do not belong to the checkpoint being reverted to.
         self.db.execute(
             delete(Message).where(
                 Message.chat_id == chat_id,
-                or_(
-                    Message.timestamp > cutoff,
-                    and_(
-                        Message.timestamp == cutoff,
-                        or_(Message.checkpoint_id.is_(None), Message.checkpoint_id != checkpoint_id),
-                    ),
+                _after_checkpoint(Message, cutoff, checkpoint_id),
+            ),
+            execution_options=_NO_SESSION_SYNC,
+        )
+        # Must run before the tool_calls delete below, which its subquery reads.
+        self.db.execute(
+            delete(SubAgentRun).where(
+                SubAgentRun.chat_id == chat_id,
+                SubAgentRun.tool_call_id.in_(
+                    select(ToolCall.id).where(
+                        ToolCall.chat_id == chat_id,
+                        _after_checkpoint(ToolCall, cutoff, checkpoint_id),
+                    )
                 ),
-            )
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
-        tool_call_ids_to_remove = [
-            t.id
-            for t in self.list_tool_calls_after_checkpoint(chat_id, cutoff, checkpoint_id)
-        ]
-        if tool_call_ids_to_remove:
-            self.db.execute(
-                delete(SubAgentRun).where(
-                    SubAgentRun.chat_id == chat_id,
-                    SubAgentRun.tool_call_id.in_(tool_call_ids_to_remove),
-                )
-            )
         self.db.execute(
             delete(ToolCall).where(
                 ToolCall.chat_id == chat_id,
-                or_(
-                    ToolCall.timestamp > cutoff,
-                    and_(
-                        ToolCall.timestamp == cutoff,
-                        or_(ToolCall.checkpoint_id.is_(None), ToolCall.checkpoint_id != checkpoint_id),
-                    ),
-                ),
-            )
+                _after_checkpoint(ToolCall, cutoff, checkpoint_id),
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
         self.db.execute(
             delete(FileEdit).where(
                 FileEdit.chat_id == chat_id,
-                or_(
-                    FileEdit.timestamp > cutoff,
-                    and_(
-                        FileEdit.timestamp == cutoff,
-                        or_(FileEdit.checkpoint_id.is_(None), FileEdit.checkpoint_id != checkpoint_id),
-                    ),
-                ),
-            )
+                _after_checkpoint(FileEdit, cutoff, checkpoint_id),
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
         self.db.execute(
             delete(ReasoningBlock).where(
                 ReasoningBlock.chat_id == chat_id,
-                or_(
-                    ReasoningBlock.timestamp > cutoff,
-                    and_(
-                        ReasoningBlock.timestamp == cutoff,
-                        or_(ReasoningBlock.checkpoint_id.is_(None), ReasoningBlock.checkpoint_id != checkpoint_id),
-                    ),
-                ),
-            )
+                _after_checkpoint(ReasoningBlock, cutoff, checkpoint_id),
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
         self.db.execute(
             delete(Checkpoint).where(
@@ -1145,7 +1291,8 @@ class ChatRepository(BaseRepository):
                         Checkpoint.timestamp == cutoff, Checkpoint.id != checkpoint_id
                     ),
                 ),
-            )
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
         self._revert_observational_memory_after_timestamp(
             chat_id=chat_id,
@@ -11,7 +11,7 @@ class MCPRepository(BaseRepository):
     def list_enabled_servers(self) -> list[MCPServer]:
         stmt = (
             select(MCPServer)
-            .where(MCPServer.enabled == 1)
+            .where(MCPServer.enabled.is_(True))
             .order_by(MCPServer.name.asc(), MCPServer.id.asc())
         )
         return list(self.db.scalars(stmt).all())
@@ -36,7 +36,7 @@ class MCPRepository(BaseRepository):
             name=name,
             transport=transport,
             config_json=config_json,
-            enabled=1,
+            enabled=True,
             last_connected_at=None,
         )
         self.db.add(server)
@@ -64,7 +64,7 @@ class MCPRepository(BaseRepository):
             self.db.delete(server)
 
     def set_server_enabled(self, server: MCPServer, enabled: bool) -> None:
-        server.enabled = 1 if enabled else 0
+        server.enabled = enabled
 
     def list_cached_tools(self) -> list[MCPToolCache]:
         stmt = select(MCPToolCache).order_by(MCPToolCache.tool_name.asc(), MCPToolCache.id.asc())
@@ -79,7 +79,7 @@ class MCPRepository(BaseRepository):
             .order_by(MCPToolCache.tool_name.asc(), MCPToolCache.id.asc())
         )
         if enabled_only:
-            stmt = stmt.where(MCPToolCache.enabled == 1)
+            stmt = stmt.where(MCPToolCache.enabled.is_(True))
         return list(self.db.scalars(stmt).all())
 
     def get_cached_tool(self, tool_id: str) -> MCPToolCache | None:
@@ -101,7 +101,7 @@ class MCPRepository(BaseRepository):
                 self.db.add(tool)
 
     def set_tool_enabled(self, tool: MCPToolCache, enabled: bool) -> None:
-        tool.enabled = 1 if enabled else 0
+        tool.enabled = enabled
 
     def set_last_connected(self, server: MCPServer, timestamp: str) -> None:
         server.last_connected_at = timestamp
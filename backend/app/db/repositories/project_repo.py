@@ -14,6 +14,13 @@ class ProjectRepository(BaseRepository):
     def get_project(self, project_id: str) -> Project | None:
         return self.db.get(Project, project_id)
 
+    def get_projects(self, project_ids: list[str]) -> dict[str, Project]:
+        """Projects by id in one IN query; ids that do not exist are omitted."""
+        if not project_ids:
+            return {}
+        stmt = select(Project).where(Project.id.in_(project_ids))
+        return {project.id: project for project in self.db.scalars(stmt)}
+
     def create_project(self, project: Project) -> Project:
         self.db.add(project)
         return project
@@ -36,9 +43,35 @@ class ProjectRepository(BaseRepository):
         )
         return list(self.db.scalars(stmt).all())
 
+    def list_chats_for_projects(self, project_ids: list[str]) -> dict[str, list[Chat]]:
+        """Chats for several projects in one query, each list in sidebar order."""
+        result: dict[str, list[Chat]] = {project_id: [] for project_id in project_ids}
+        if not project_ids:
+            return result
+        stmt = (
+            select(Chat)
+            .where(Chat.project_id.in_(project_ids))
+            .order_by(
+                Chat.project_id,
+                Chat.is_pinned.desc(),
+                Chat.sort_order.asc(),
+                Chat.updated_at.desc(),
+            )
+        )
+        for chat in self.db.scalars(stmt):
+            result[chat.project_id].append(chat)
+        return result
+
     def get_chat(self, chat_id: str) -> Chat | None:
         return self.db.get(Chat, chat_id)
 
+    def get_chats(self, chat_ids: list[str]) -> dict[str, Chat]:
+        """Chats by id in one IN query; ids that do not exist are omitted."""
+        if not chat_ids:
+            return {}
+        stmt = select(Chat).where(Chat.id.in_(chat_ids))
+        return {chat.id: chat for chat in self.db.scalars(stmt)}
+
     def create_chat(self, chat: Chat) -> Chat:
         self.db.add(chat)
         return chat
@@ -47,7 +80,7 @@ class ProjectRepository(BaseRepository):
         if title is not None:
             chat.title = title
         if is_pinned is not None:
-            chat.is_pinned = 1 if is_pinned else 0
+            chat.is_pinned = is_pinned
         return chat
 
     def delete_chat(self, chat: Chat) -> None:
@@ -61,6 +94,28 @@ class ProjectRepository(BaseRepository):
         stmt = select(func.count(Message.id)).where(Message.chat_id == chat_id)
         return int(self.db.scalar(stmt) or 0)
 
+    def get_message_summaries_for_chats(self, chat_ids: list[str]) -> dict[str, tuple[str, int]]:
+        """(last message content, message count) per chat, in a single query.
+
+        Chats without messages are omitted.
+        """
+        if not chat_ids:
+            return {}
+        ranked = (
+            select(
+                Message.chat_id,
+                Message.content,
+                func.row_number()
+                .over(partition_by=Message.chat_id, order_by=Message.timestamp.desc())
+                .label("rn"),
+                func.count().over(partition_by=Message.chat_id).label("cnt"),
+            )
+            .where(Message.chat_id.in_(chat_ids))
+            .subquery()
+        )
+        stmt = select(ranked.c.chat_id, ranked.c.content, ranked.c.cnt).where(ranked.c.rn == 1)
+        return {chat_id: (content, int(cnt)) for chat_id, content, cnt in self.db.execute(stmt)}
+
     def get_next_project_sort_order(self) -> int:
         stmt = select(func.max(Project.sort_order))
         current = self.db.scalar(stmt)
@@ -72,15 +127,17 @@ class ProjectRepository(BaseRepository):
         return int(current) + 1 if current is not None else 0
 
     def set_project_order(self, project_ids: list[str]) -> None:
+        projects = self.get_projects(project_ids)
         for idx, project_id in enumerate(project_ids):
-            project = self.get_project(project_id)
+            project = projects.get(project_id)
             if project is None:
                 raise ValueError(f"Project not found: {project_id}")
             project.sort_order = idx
 
     def set_chat_order(self, project_id: str, chat_ids: list[str]) -> None:
+        chats = self.get_chats(chat_ids)
         for idx, chat_id in enumerate(chat_ids):
-            chat = self.get_chat(chat_id)
+            chat = chats.get(chat_id)
             if chat is None:
                 raise ValueError(f"Chat not found: {chat_id}")
             if chat.project_id != project_id:
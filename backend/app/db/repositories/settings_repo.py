@@ -1,4 +1,7 @@
-from sqlalchemy import delete, select
+import time
+
+from sqlalchemy import delete, event, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
 
 from app.db.models.auto_approve_rule import AutoApproveRule
 from app.db.models.provider_model_cache import ProviderModelCache
@@ -6,13 +9,79 @@ from app.db.models.settings import Settings
 from app.db.repositories.base_repo import BaseRepository
 
 
+# Process-local snapshot of the single settings row, shared across sessions.
+# Writes made through the ORM in this process invalidate it as soon as they are
+# flushed and again on commit; the TTL bounds staleness for writes made by
+# other processes.
+_SETTINGS_CACHE_TTL_SECONDS = 5.0
+_settings_cache: dict[int, tuple[float, Settings]] = {}
+
+
+def reset_settings_cache() -> None:
+    _settings_cache.clear()
+
+
+def _snapshot(settings: Settings) -> Settings:
+    """Detached copy of the loaded columns; never attached to a session itself."""
+    state = inspect(settings)
+    copy = Settings(
+        **{
+            attr.key: getattr(settings, attr.key)
+            for attr in state.mapper.column_attrs
+            if attr.key not in state.unloaded
+        }
+    )
+    make_transient_to_detached(copy)
+    return copy
+
+
+@event.listens_for(Settings, "after_insert")
+@event.listens_for(Settings, "after_update")
+@event.listens_for(Settings, "after_delete")
+def _invalidate_on_write(mapper, connection, target: Settings) -> None:
+    _settings_cache.clear()
+    session = object_session(target)
+    if session is not None:
+        session.info["settings_written"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    # A reader in another session may have re-cached the pre-commit row between
+    # our flush and commit.
+    if session.info.pop("settings_written", False):
+        _settings_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_write(session: Session) -> None:
+    session.info.pop("settings_written", None)
+
+
 class SettingsRepository(BaseRepository):
     def get_settings(self) -> Settings | None:
-        return self.db.get(Settings, 1)
+        # An instance already in this session may carry unflushed edits; merging
+        # the snapshot over it would discard them.
+        current = self.db.identity_map.get(self.db.identity_key(Settings, 1))
+        if current is not None:
+            return current
+        cached = _settings_cache.get(1)
+        if cached is not None and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL_SECONDS:
+            # load=False attaches a copy without emitting a SELECT; setters then
+            # mutate that copy and flush normally.
+            return self.db.merge(cached[1], load=False)
+        settings = self.db.get(Settings, 1)
+        if settings is not None:
+            _settings_cache[1] = (time.monotonic(), _snapshot(settings))
+        return settings
 
     def list_models(self) -> list[ProviderModelCache]:
         return list(self.db.scalars(select(ProviderModelCache).order_by(ProviderModelCache.label.asc())).all())
 
+    def has_models_for_provider(self, provider: str) -> bool:
+        stmt = select(ProviderModelCache.label).where(ProviderModelCache.provider == provider).limit(1)
+        return self.db.scalars(stmt).first() is not None
+
     def replace_models(self, models: list[ProviderModelCache]) -> list[ProviderModelCache]:
         self.db.execute(delete(ProviderModelCache).where(ProviderModelCache.provider == "openrouter"))
         for model in models:
@@ -328,7 +397,7 @@ class SettingsRepository(BaseRepository):
         if reflector_threshold is not None:
             s.reflector_threshold = reflector_threshold
         if show_observations_in_chat is not None:
-            s.show_observations_in_chat = 1 if show_observations_in_chat else 0
+            s.show_observations_in_chat = show_observations_in_chat
         if tool_output_token_threshold is not None:
             s.tool_output_token_threshold = max(1, tool_output_token_threshold)
         if tool_output_preview_tokens is not None:
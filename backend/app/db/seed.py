@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import logging
 
@@ -87,7 +86,7 @@ def seed_app_data(db: Session) -> None:
                     provider="openrouter",
                     label=model,
                     context_limit=settings.default_context_limit,
-                    raw_json=json.dumps({"id": model, "provider": "openrouter"}),
+                    raw_json={"id": model, "provider": "openrouter"},
                     fetched_at=now,
                 )
             )
@@ -98,7 +97,7 @@ def seed_app_data(db: Session) -> None:
                 id="aar-1",
                 field="tool",
                 value="read_file",
-                enabled=1,
+                enabled=True,
                 created_at=now,
             )
         )
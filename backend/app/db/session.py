@@ -1,5 +1,5 @@
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload, sessionmaker
 
 from app.config.settings import get_settings
 
@@ -13,7 +13,26 @@ def get_engine():
         return _engine
     settings = get_settings()
     connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-    _engine = create_engine(settings.database_url, future=True, connect_args=connect_args)
+    url = make_url(settings.database_url)
+    pool_args: dict = {}
+    # In-memory SQLite (`sqlite://`, `sqlite:///:memory:`) uses a per-thread
+    # singleton pool that takes no size or overflow.
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        pool_args = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+        }
+        if url.get_backend_name() != "sqlite":
+            # Network databases drop idle connections; local SQLite files do not.
+            pool_args.update(pool_pre_ping=True, pool_recycle=1800)
+    # Larger compiled-statement cache: many models x query shapes overflow the default 500.
+    _engine = create_engine(
+        settings.database_url,
+        future=True,
+        connect_args=connect_args,
+        query_cache_size=2048,
+        **pool_args,
+    )
 
     if "sqlite" in settings.database_url:
 
@@ -21,6 +40,13 @@ def get_engine():
         def _set_sqlite_pragma(dbapi_conn, connection_record):
             cursor = dbapi_conn.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
+            # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+            # syncs at checkpoints rather than on every small commit (still crash-safe).
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA temp_store=MEMORY")
             cursor.close()
 
     return _engine
@@ -33,10 +59,21 @@ def reset_engine() -> None:
     _engine = None
 
 
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    # Relationships a query did not eager-load raise on access rather than issuing
+    # one SELECT per parent row; identity-map hits are still allowed.
+    if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
 def get_sessionmaker() -> sessionmaker[Session]:
     global _sessionmaker
     if _sessionmaker is None:
         _sessionmaker = sessionmaker(bind=get_engine(), expire_on_commit=False, class_=Session)
+        if get_settings().orm_raise_on_lazy_load:
+            event.listen(_sessionmaker, "do_orm_execute", _raise_on_lazy_load)
     return _sessionmaker
 
 
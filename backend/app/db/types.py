@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any
+
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+
+def _dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(value, sort_keys=True)
+
+
+def _loads(raw: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class JSONText(TypeDecorator):
+    """JSON value stored as TEXT; decoded once per row load instead of at each read.
+
+    Malformed legacy rows load as None so readers can fall back to defaults.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> str | None:
+        if value is None:
+            return None
+        return _dumps(value)
+
+    def process_result_value(self, value: str | None, dialect) -> Any:
+        if not value:
+            return None
+        try:
+            return _loads(value)
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+            return None
+
+
+class InternedText(TypeDecorator):
+    """TEXT column with a small fixed vocabulary (roles, statuses, kinds).
+
+    Loaded values are interned so every row shares one string object per value.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_result_value(self, value: str | None, dialect) -> str | None:
+        return sys.intern(value) if value is not None else None
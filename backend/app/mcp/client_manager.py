@@ -3,12 +3,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Protocol
 
 from sqlalchemy.orm import Session
 
-from app.core.container import get_container
+from app.core.container import get_container, set_container
 from app.db.models.mcp_tool_cache import MCPToolCache
 from app.db.repositories.mcp_repo import MCPRepository
 from app.mcp.protocol_models import (
@@ -88,13 +89,7 @@ class MCPClientManager:
                 for cached in repo.list_cached_tools_for_server(
                     server.id, enabled_only=True
                 ):
-                    schema = {}
-                    try:
-                        schema_value = json.loads(cached.schema_json)
-                        if isinstance(schema_value, dict):
-                            schema = schema_value
-                    except json.JSONDecodeError:
-                        pass
+                    schema = cached.schema_json if isinstance(cached.schema_json, dict) else {}
                     discovered.append(
                         MCPToolDescriptor(
                             server_id=server.id,
@@ -117,13 +112,13 @@ class MCPClientManager:
                 cache_rows = []
                 for tool in tools:
                     prev = existing.get(tool.name)
-                    enabled = prev.enabled if prev else 1
+                    enabled = prev.enabled if prev else True
                     cache_rows.append(
                         MCPToolCache(
                             id=f"mcpt-{server.id}-{tool.name}",
                             server_id=server.id,
                             tool_name=tool.name,
-                            schema_json=json.dumps(tool.input_schema, sort_keys=True),
+                            schema_json=tool.input_schema,
                             description=tool.description,
                             discovered_at=self._now(),
                             enabled=enabled,
@@ -144,13 +139,7 @@ class MCPClientManager:
                 for cached in repo.list_cached_tools_for_server(
                     server.id, enabled_only=True
                 ):
-                    schema = {}
-                    try:
-                        schema_value = json.loads(cached.schema_json)
-                        if isinstance(schema_value, dict):
-                            schema = schema_value
-                    except json.JSONDecodeError:
-                        schema = {}
+                    schema = cached.schema_json if isinstance(cached.schema_json, dict) else {}
                     discovered.append(
                         MCPToolDescriptor(
                             server_id=server.id,
@@ -189,4 +178,4 @@ def reset_mcp_client_manager() -> None:
     container = get_container()
     if container is None:
         return
-    container.mcp_client_manager = MCPClientManager()
+    set_container(replace(container, mcp_client_manager=MCPClientManager()))
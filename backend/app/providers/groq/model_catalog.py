@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -62,7 +61,7 @@ class GroqModelCatalogService:
                     provider="groq",
                     label=model_id,
                     context_limit=self._parse_context_limit(item),
-                    raw_json=json.dumps(item),
+                    raw_json=item,
                     fetched_at=fetched_at,
                 )
             )
@@ -76,7 +75,7 @@ class GroqModelCatalogService:
                 provider="groq",
                 label=model,
                 context_limit=self.app_settings.default_context_limit,
-                raw_json=json.dumps({"id": model, "provider": "groq", "fallback": True}),
+                raw_json={"id": model, "provider": "groq", "fallback": True},
                 fetched_at=fetched_at,
             )
             for model in GROQ_FALLBACK_MODELS
@@ -112,11 +111,11 @@ class GroqModelCatalogService:
             if normalized:
                 self.repo.replace_models_for_provider("groq", normalized)
                 self.repo.commit()
-            elif not any(m.provider == "groq" for m in self.repo.list_models()):
+            elif not self.repo.has_models_for_provider("groq"):
                 self.repo.replace_models_for_provider("groq", self._fallback_rows(fetched_at))
                 self.repo.commit()
         except Exception:
-            if not any(m.provider == "groq" for m in self.repo.list_models()):
+            if not self.repo.has_models_for_provider("groq"):
                 self.repo.replace_models_for_provider("groq", self._fallback_rows(fetched_at))
                 self.repo.commit()
 
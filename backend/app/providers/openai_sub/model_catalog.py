@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -64,7 +63,7 @@ class OpenAISubModelCatalogService:
                     provider="openai-sub",
                     label=model_id,
                     context_limit=ctx,
-                    raw_json=json.dumps(
+                    raw_json=(
                         {"provider": "openai-sub", **item}
                         if "provider" not in item
                         else item
@@ -82,7 +81,7 @@ class OpenAISubModelCatalogService:
                 provider="openai-sub",
                 label=label,
                 context_limit=ctx,
-                raw_json=json.dumps({"id": label, "provider": "openai-sub"}),
+                raw_json={"id": label, "provider": "openai-sub"},
                 fetched_at=fetched_at,
             )
             for label, ctx in OPENAI_SUB_FALLBACK_MODELS
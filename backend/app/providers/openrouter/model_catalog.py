@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -50,7 +49,7 @@ class OpenRouterModelCatalogService:
                     provider="openrouter",
                     label=model_id,
                     context_limit=self._parse_context_limit(item),
-                    raw_json=json.dumps(item),
+                    raw_json=item,
                     fetched_at=fetched_at,
                 )
             )
@@ -64,7 +63,7 @@ class OpenRouterModelCatalogService:
                 provider="openrouter",
                 label=model,
                 context_limit=self.app_settings.default_context_limit,
-                raw_json=json.dumps({"id": model, "provider": "openrouter", "fallback": True}),
+                raw_json={"id": model, "provider": "openrouter", "fallback": True},
                 fetched_at=fetched_at,
             )
             for model in self.app_settings.fallback_models
@@ -128,13 +127,13 @@ class OpenRouterModelCatalogService:
             if normalized:
                 self.repo.replace_models_for_provider("openrouter", normalized)
                 self.repo.commit()
-            elif not any(m.provider == "openrouter" for m in self.repo.list_models()):
+            elif not self.repo.has_models_for_provider("openrouter"):
                 self.repo.replace_models_for_provider(
                     "openrouter", self._fallback_rows(fetched_at)
                 )
                 self.repo.commit()
         except Exception:
-            if not any(m.provider == "openrouter" for m in self.repo.list_models()):
+            if not self.repo.has_models_for_provider("openrouter"):
                 self.repo.replace_models_for_provider(
                     "openrouter", self._fallback_rows(fetched_at)
                 )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -56,10 +55,7 @@ def model_has_vision(
         cached = next((m for m in models if m.provider == provider and m.label == model_label), None)
         if cached is None:
             return _vision_from_fallback(provider, model_label)
-        try:
-            raw = json.loads(cached.raw_json)
-        except (json.JSONDecodeError, TypeError):
-            return _vision_from_fallback(provider, model_label)
+        raw = cached.raw_json
 
     if not isinstance(raw, dict):
         return _vision_from_fallback(provider, model_label)
@@ -45,10 +45,16 @@ class ChatHistoryAssembler:
         if chat is None:
             raise ValueError(f"Chat not found: {chat_id}")
 
-        raw_tool_calls = self._chat_repo.list_tool_calls(chat_id)
-        raw_file_edits = self._chat_repo.list_file_edits(chat_id)
-        raw_reasoning_blocks = self._chat_repo.list_reasoning_blocks(chat_id)
-        raw_messages = self._chat_repo.list_messages(chat_id)
+        # Plain column rows: this path only serializes, so skip ORM hydration.
+        raw_tool_calls = self._chat_repo.list_tool_call_rows(chat_id)
+        raw_file_edits = self._chat_repo.list_file_edit_rows(chat_id)
+        raw_reasoning_blocks = self._chat_repo.list_reasoning_block_rows(chat_id)
+        raw_messages = self._chat_repo.list_message_rows(chat_id)
+        # One query each instead of one per message / per tool call.
+        attachments_by_message = self._chat_repo.list_attachments_for_chat(chat_id)
+        artifacts_by_tool_call: dict[str, list] = {}
+        for artifact in self._chat_repo.list_tool_artifacts_for_chat(chat_id):
+            artifacts_by_tool_call.setdefault(artifact.tool_call_id, []).append(artifact)
 
         referenced_files_by_checkpoint: dict[str, list[str]] = {}
         for t in raw_tool_calls:
@@ -68,7 +74,7 @@ class ChatHistoryAssembler:
         for m in raw_messages:
             atts: list[MessageAttachmentOut] = []
             if m.role == "user":
-                for att in self._chat_repo.list_attachments_for_message(m.id):
+                for att in attachments_by_message.get(m.id, []):
                     atts.append(
                         MessageAttachmentOut(
                             data=att.content_base64,
@@ -89,15 +95,15 @@ class ChatHistoryAssembler:
                         else []
                     ),
                     attachments=atts,
-                    imageSummarization=getattr(m, "image_summarization", None),
-                    imageSummarizationModel=getattr(m, "image_summarization_model", None),
+                    imageSummarization=m.image_summarization,
+                    imageSummarizationModel=m.image_summarization_model,
                 )
             )
 
         tool_calls = []
         for t in raw_tool_calls:
             artifacts = []
-            for artifact in self._chat_repo.list_tool_artifacts_for_tool_call(t.id):
+            for artifact in artifacts_by_tool_call.get(t.id, []):
                 artifacts.append(
                     {
                         "type": artifact.artifact_type,
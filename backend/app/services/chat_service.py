@@ -424,7 +424,7 @@ class ChatService:
         cancelled_task = False
         existing_task = self.task_manager.pop(chat_id)
         if existing_task is not None and not existing_task.done():
-            for tc in self.repo.list_tool_calls(chat_id):
+            for tc in self.repo.list_active_tool_calls(chat_id):
                 if tc.status == "pending":
                     try:
                         await ApprovalService(self.repo.db).reject(
@@ -447,9 +447,7 @@ class ChatService:
     async def _cancel_running_sub_agents(self, chat_id: str) -> None:
         """Mark any lingering in-progress sub-agent runs as cancelled and publish end events."""
         changed = []
-        for run in self.repo.list_sub_agent_runs(chat_id):
-            if run.status not in {"pending", "running"}:
-                continue
+        for run in self.repo.list_active_sub_agent_runs(chat_id):
             output_text = run.output_text or "Sub-agent cancelled."
             self.repo.set_sub_agent_run_status(
                 run,
@@ -540,8 +538,7 @@ class ChatService:
 
         await self._deny_pending_and_cancel_agent(chat_id)
 
-        existing_messages = self.repo.list_messages(chat_id)
-        is_first_message = len(existing_messages) == 0
+        is_first_message = not self.repo.has_messages(chat_id)
         if is_first_message and chat.title == "New chat":
             title = content.strip()[:64] or "New chat"
             chat.title = title
@@ -572,6 +569,9 @@ class ChatService:
         )
         self.repo.link_message_checkpoint(message, checkpoint.id)
         self.repo.update_chat_timestamp(chat, timestamp)
+        # Echo stored attachments from the request itself rather than reading the
+        # just-written (possibly multi-MB) base64 blobs back from the database.
+        attachments_out: list[dict] = []
         if attachments:
             for i, att in enumerate(attachments):
                 data_b64 = att.get("data") if isinstance(att, dict) else None
@@ -584,12 +584,8 @@ class ChatService:
                         mime_type=mime,
                         sort_order=i,
                     )
+                    attachments_out.append({"data": data_b64, "mimeType": mime, "name": None})
         self.repo.commit()
-
-        attachments_out = [
-            {"data": a.content_base64, "mimeType": a.mime_type, "name": None}
-            for a in self.repo.list_attachments_for_message(message.id)
-        ]
         message_out = MessageOut(
             id=message.id,
             role=map_role_for_ui(message.role),
@@ -859,7 +855,7 @@ class ChatService:
             created_at=now,
             updated_at=now,
             sort_order=project_repo.get_next_chat_sort_order(source_chat.project_id),
-            is_pinned=0,
+            is_pinned=False,
         )
         project_repo.create_chat(new_chat)
         project.last_active = now
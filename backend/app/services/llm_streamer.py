@@ -6,6 +6,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from app.services.token_counter import count_text_tokens
 from app.utils.ids import generate_id
 from app.utils.time import utc_now_iso
 
@@ -64,12 +65,7 @@ class LLMStreamer:
         # Commit before publishing so the block is queryable when the frontend
         # calls getChatHistory in response to this event.
         self._chat_repo.commit()
-        try:
-            import tiktoken
-            _enc = tiktoken.get_encoding("cl100k_base")
-            tokens = len(_enc.encode(content))
-        except Exception:
-            tokens = max(1, len(content) // 4)
+        tokens = count_text_tokens(content)
         block_out = {
             "id": rb_id,
             "content": content,
@@ -33,7 +33,7 @@ class MCPService:
                     "name": s.name,
                     "transport": s.transport,
                     "configJson": s.config_json,
-                    "enabled": bool(s.enabled),
+                    "enabled": s.enabled,
                     "lastConnectedAt": s.last_connected_at,
                     "tools": [
                         {
@@ -41,7 +41,7 @@ class MCPService:
                             "serverId": t.server_id,
                             "toolName": t.tool_name,
                             "description": t.description,
-                            "enabled": bool(t.enabled),
+                            "enabled": t.enabled,
                             "discoveredAt": t.discovered_at,
                         }
                         for t in tools
@@ -70,7 +70,7 @@ class MCPService:
             "name": server.name,
             "transport": server.transport,
             "configJson": server.config_json,
-            "enabled": bool(server.enabled),
+            "enabled": server.enabled,
             "lastConnectedAt": server.last_connected_at,
             "tools": [],
         }
@@ -100,7 +100,7 @@ class MCPService:
             "name": server.name,
             "transport": server.transport,
             "configJson": server.config_json,
-            "enabled": bool(server.enabled),
+            "enabled": server.enabled,
             "lastConnectedAt": server.last_connected_at,
             "tools": [
                 {
@@ -108,7 +108,7 @@ class MCPService:
                     "serverId": t.server_id,
                     "toolName": t.tool_name,
                     "description": t.description,
-                    "enabled": bool(t.enabled),
+                    "enabled": t.enabled,
                     "discoveredAt": t.discovered_at,
                 }
                 for t in tools
@@ -137,7 +137,7 @@ class MCPService:
             "name": server.name,
             "transport": server.transport,
             "configJson": server.config_json,
-            "enabled": bool(server.enabled),
+            "enabled": server.enabled,
             "lastConnectedAt": server.last_connected_at,
             "tools": [
                 {
@@ -145,7 +145,7 @@ class MCPService:
                     "serverId": t.server_id,
                     "toolName": t.tool_name,
                     "description": t.description,
-                    "enabled": bool(t.enabled),
+                    "enabled": t.enabled,
                     "discoveredAt": t.discovered_at,
                 }
                 for t in tools
@@ -164,7 +164,7 @@ class MCPService:
             "serverId": tool.server_id,
             "toolName": tool.tool_name,
             "description": tool.description,
-            "enabled": bool(tool.enabled),
+            "enabled": tool.enabled,
             "discoveredAt": tool.discovered_at,
         }
 
@@ -224,7 +224,7 @@ class OMBackgroundRunner:
                 svc = ObservationMemoryService(repo)
 
                 db_messages = []
-                for m in repo.list_messages(chat_id):
+                for m in repo.iter_message_rows(chat_id):
                     role = "assistant" if m.role == "assistant" else "user"
                     db_messages.append(
                         {
@@ -569,7 +569,7 @@ class OMBackgroundRunner:
                     }
                 )
 
-        for tc in repo.list_tool_calls(chat_id):
+        for tc in repo.iter_tool_call_rows(chat_id):
             if (
                 latest_observation_timestamp is not None
                 and tc.timestamp <= latest_observation_timestamp
@@ -590,7 +590,7 @@ class OMBackgroundRunner:
                 }
             )
 
-        for rb in repo.list_reasoning_blocks(chat_id):
+        for rb in repo.iter_reasoning_block_rows(chat_id):
             if (
                 latest_observation_timestamp is not None
                 and rb.timestamp <= latest_observation_timestamp
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -17,7 +16,7 @@ from app.services.memory.observational.prompts import (
     build_reflector_prompt,
     parse_observation_output,
 )
-from app.services.token_counter import count_messages_tokens
+from app.services.token_counter import count_messages_tokens, count_text_tokens
 from app.utils.ids import generate_id
 from app.utils.messages import strip_message_metadata
 from app.utils.time import utc_now_iso
@@ -93,12 +92,7 @@ def _count_tokens(text: str) -> int:
     """Count tokens using tiktoken (cl100k_base), falling back to char/4 estimate."""
     if not text:
         return 0
-    try:
-        import tiktoken
-        enc = tiktoken.get_encoding("cl100k_base")
-        return len(enc.encode(text)) or 1
-    except Exception:
-        return max(1, len(text) // 4)
+    return count_text_tokens(text) or 1
 
 
 def _today_str() -> str:
@@ -186,14 +180,9 @@ class ObservationMemoryService:
         if (
             state_row is not None
             and state_row.strategy == "observational"
-            and isinstance(state_row.state_json, str)
+            and isinstance(state_row.state_json, dict)
         ):
-            try:
-                raw = json.loads(state_row.state_json)
-                if isinstance(raw, dict):
-                    parsed = raw
-            except Exception:
-                parsed = {}
+            parsed = state_row.state_json
 
         buffer_candidate = parsed.get("buffer")
         if isinstance(buffer_candidate, dict):
@@ -258,7 +247,7 @@ class ObservationMemoryService:
         self._chat_repo.set_memory_state(
             chat_id=chat_id,
             strategy="observational",
-            state_json=json.dumps(state),
+            state_json=state,
             updated_at=utc_now_iso(),
         )
         self._chat_repo.commit()
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import uuid
+from pathlib import Path
 
 from app.services.token_counter import count_text_tokens, extract_preview_by_tokens
 from app.tools.path_utils import get_tool_outputs_root
@@ -13,6 +15,29 @@ logger = logging.getLogger(__name__)
 TOOL_OUTPUT_TOKEN_THRESHOLD = 2000
 PREVIEW_TOKENS = 500
 
+# Spill directories already created in this process; avoids a mkdir/stat per spill.
+_KNOWN_DIRS: set[str] = set()
+
+
+def _write_atomic(base_dir: Path, out_path: Path, output: str) -> None:
+    """Write output via a temp file + rename so readers never see a partial file."""
+    dir_key = str(base_dir)
+    if dir_key not in _KNOWN_DIRS:
+        base_dir.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(dir_key)
+    tmp_path = out_path.with_suffix(".txt.tmp")
+    try:
+        tmp_path.write_text(output, encoding="utf-8")
+        os.replace(tmp_path, out_path)
+    except OSError:
+        # Directory may have been removed out from under us; re-check next time.
+        _KNOWN_DIRS.discard(dir_key)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
 
 def spill_tool_output(
     output: str,
@@ -38,8 +63,7 @@ def spill_tool_output(
     out_path = base_dir / f"{output_uuid}.txt"
 
     try:
-        base_dir.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(output, encoding="utf-8")
+        _write_atomic(base_dir, out_path, output)
     except OSError as exc:
         logger.warning("Failed to spill tool output to %s: %s", out_path, exc)
         return output, None, None
@@ -39,8 +39,6 @@ class PlanService:
         self.repo.create_project_plan_revision(
             revision_id=generate_id("prv"),
             plan_id=row.id,
-            chat_id=row.chat_id,
-            project_id=row.project_id,
             checkpoint_id=checkpoint_id,
             revision=row.revision,
             title=row.title,
@@ -41,22 +41,36 @@ class ProjectService:
             raise ValueError(f"Directory does not exist: {raw_path}")
         return str(path)
 
-    def _chat_out(self, chat: Chat) -> ProjectChatOut:
-        last_msg = self.repo.get_last_message_for_chat(chat.id)
+    def _chat_out(
+        self, chat: Chat, summary: tuple[str, int] | None = None
+    ) -> ProjectChatOut:
+        if summary is None:
+            last_msg = self.repo.get_last_message_for_chat(chat.id)
+            summary = (
+                last_msg.content if last_msg else "",
+                self.repo.get_message_count_for_chat(chat.id),
+            )
+        last_message, message_count = summary
         return ProjectChatOut(
             id=chat.id,
             title=chat.title,
-            lastMessage=last_msg.content if last_msg else "",
+            lastMessage=last_message,
             timestamp=chat.updated_at,
-            messageCount=self.repo.get_message_count_for_chat(chat.id),
-            isPinned=bool(chat.is_pinned),
+            messageCount=message_count,
+            isPinned=chat.is_pinned,
         )
 
-    def _project_out(self, project: Project) -> ProjectOut:
-        chats_out = [
-            self._chat_out(chat)
-            for chat in self.repo.list_chats_for_project(project.id)
-        ]
+    def _project_out(
+        self,
+        project: Project,
+        chats: list[Chat] | None = None,
+        summaries: dict[str, tuple[str, int]] | None = None,
+    ) -> ProjectOut:
+        if chats is None:
+            chats = self.repo.list_chats_for_project(project.id)
+        if summaries is None:
+            summaries = self.repo.get_message_summaries_for_chats([c.id for c in chats])
+        chats_out = [self._chat_out(chat, summaries.get(chat.id, ("", 0))) for chat in chats]
         return ProjectOut(
             id=project.id,
             name=project.name,
@@ -67,8 +81,19 @@ class ProjectService:
         )
 
     def get_projects(self) -> GetProjectsResponse:
-        projects = [self._project_out(project) for project in self.repo.list_projects()]
-        return GetProjectsResponse(projects=projects)
+        # Three queries total (projects, chats, message summaries) instead of
+        # one chats query per project plus two message queries per chat.
+        projects = self.repo.list_projects()
+        chats_by_project = self.repo.list_chats_for_projects([p.id for p in projects])
+        summaries = self.repo.get_message_summaries_for_chats(
+            [chat.id for chats in chats_by_project.values() for chat in chats]
+        )
+        return GetProjectsResponse(
+            projects=[
+                self._project_out(project, chats_by_project[project.id], summaries)
+                for project in projects
+            ]
+        )
 
     def create_project(self, *, name: str, path: str) -> CreateProjectResponse:
         now = self._now()
@@ -134,7 +159,7 @@ class ProjectService:
             created_at=now,
             updated_at=now,
             sort_order=self.repo.get_next_chat_sort_order(project_id),
-            is_pinned=0,
+            is_pinned=False,
         )
         self.repo.create_chat(chat)
         project.last_active = now
@@ -55,8 +55,7 @@ class RevertService:
 
         plans = self.repo.list_project_plans(chat_id)
         for plan in plans:
-            revisions = self.repo.list_project_plan_revisions(plan.id)
-            if not revisions:
+            if not self.repo.has_project_plan_revisions(plan.id):
                 # Legacy fallback for plans created before revision ledger existed.
                 created_after = self._is_after_cutoff(
                     row_timestamp=plan.created_at,
@@ -117,7 +116,7 @@ class RevertService:
                 Path(artifact.file_path).unlink(missing_ok=True)
 
         # Restore files from snapshots (reverse chronological so last changes are undone first)
-        snapshots = self.repo.list_file_snapshots_after_checkpoint(
+        snapshots = self.repo.take_file_snapshots_after_checkpoint(
             chat_id, checkpoint.timestamp, checkpoint_id
         )
         for snapshot in snapshots:
@@ -130,9 +129,6 @@ class RevertService:
                 path.parent.mkdir(parents=True, exist_ok=True)
                 path.write_text(snapshot.content, encoding="utf-8")
 
-        self.repo.delete_file_snapshots_after_checkpoint(
-            chat_id, checkpoint.timestamp, checkpoint_id
-        )
         self.repo.delete_after_checkpoint(
             chat_id=chat_id,
             cutoff_timestamp=checkpoint.timestamp,
@@ -185,6 +181,6 @@ class RevertService:
                 if isinstance(f.checkpoint_id, str)
                 else "",
             )
-            for f in self.repo.list_file_edits(chat_id)
+            for f in self.repo.list_file_edit_rows(chat_id)
         ]
         return RevertFileResponse(removedFileEditId=file_edit_id, fileEdits=remaining)
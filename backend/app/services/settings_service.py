@@ -14,7 +14,7 @@ from app.utils.time import utc_now_iso
 from app.db.models.auto_approve_rule import AutoApproveRule
 from app.config.settings import get_settings
 from app.db.repositories.settings_repo import SettingsRepository
-from app.config.prompts import DEFAULT_SYSTEM_PROMPT
+from app.config.prompts import DEFAULT_SYSTEM_PROMPT, SUB_AGENT_SYSTEM_PROMPT
 from app.schemas.settings import (
     AutoApproveRuleIn,
     AutoApproveRuleOut,
@@ -91,7 +91,7 @@ class SettingsService:
                     id=r.id,
                     field=r.field,
                     value=r.value,
-                    enabled=bool(r.enabled),
+                    enabled=r.enabled,
                     createdAt=r.created_at,
                 )
                 for r in rules
@@ -140,39 +140,27 @@ class SettingsService:
 
     def _model_metadata(self) -> dict[str, ModelMetadata]:
         """Return metadata (contextLimit, pricePerMillion) per model label from raw_json."""
-        import json
-
         models = self.repo.list_models()
         result: dict[str, ModelMetadata] = {}
         for m in models:
             if m.label in result:
                 continue
-            result[m.label] = self._extract_model_metadata(m, json)
+            result[m.label] = self._extract_model_metadata(m)
         return result
 
     def _model_metadata_by_key(self) -> dict[str, ModelMetadata]:
         """Return metadata keyed by stable model key provider::label."""
-        import json
-
         models = self.repo.list_models()
         result: dict[str, ModelMetadata] = {}
         for m in models:
-            result[self._to_model_key(m.provider, m.label)] = self._extract_model_metadata(
-                m, json
-            )
+            result[self._to_model_key(m.provider, m.label)] = self._extract_model_metadata(m)
         return result
 
-    def _extract_model_metadata(self, model: ProviderModelCache, json_module) -> ModelMetadata:
+    def _extract_model_metadata(self, model: ProviderModelCache) -> ModelMetadata:
         meta: dict = {}
         if model.context_limit is not None:
             meta["contextLimit"] = model.context_limit
-        raw: dict = {}
-        try:
-            raw = json_module.loads(model.raw_json) if model.raw_json else {}
-            if not isinstance(raw, dict):
-                raw = {}
-        except (json_module.JSONDecodeError, TypeError):
-            raw = {}
+        raw = model.raw_json if isinstance(model.raw_json, dict) else {}
         try:
             pricing = raw.get("pricing") if isinstance(raw, dict) else {}
             if isinstance(pricing, dict):
@@ -190,7 +178,7 @@ class SettingsService:
             meta["reasoningSupported"] = reasoning_caps.supported
             meta["reasoningLevels"] = list(reasoning_caps.levels)
             meta["defaultReasoningLevel"] = reasoning_caps.default_level
-        except (json_module.JSONDecodeError, TypeError):
+        except TypeError:
             pass
         raw_dict = raw if isinstance(raw, dict) else None
         meta["vision"] = model_has_vision(
@@ -357,7 +345,7 @@ class SettingsService:
                     id=r.id,
                     field=r.field,
                     value=r.value,
-                    enabled=bool(r.enabled),
+                    enabled=r.enabled,
                     createdAt=r.created_at,
                 )
                 for r in rules
@@ -373,7 +361,7 @@ class SettingsService:
                 id=generate_id("aar"),
                 field=r.field,
                 value=r.value,
-                enabled=1 if r.enabled else 0,
+                enabled=r.enabled,
                 created_at=now,
             )
             for r in rules
@@ -386,7 +374,7 @@ class SettingsService:
                     id=r.id,
                     field=r.field,
                     value=r.value,
-                    enabled=bool(r.enabled),
+                    enabled=r.enabled,
                     createdAt=r.created_at,
                 )
                 for r in rows
@@ -402,7 +390,7 @@ class SettingsService:
             id=generate_id("aar"),
             field=field.strip(),
             value=value.strip(),
-            enabled=1 if enabled else 0,
+            enabled=enabled,
             created_at=now,
         )
         self.repo.add_auto_approve_rule(rule)
@@ -411,7 +399,7 @@ class SettingsService:
             id=rule.id,
             field=rule.field,
             value=rule.value,
-            enabled=bool(rule.enabled),
+            enabled=rule.enabled,
             createdAt=rule.created_at,
         )
 
@@ -681,6 +669,12 @@ class SettingsService:
         custom = self.repo.get_system_prompt()
         return custom if custom else DEFAULT_SYSTEM_PROMPT
 
+    def get_sub_agent_system_prompt(self) -> str:
+        """Return the prompt for sub-agents: the custom prompt if set, else the
+        default without the sub-agent section (sub-agents cannot spawn sub-agents)."""
+        custom = self.repo.get_system_prompt()
+        return custom if custom else SUB_AGENT_SYSTEM_PROMPT
+
     def set_system_prompt(self, prompt: str) -> SetSystemPromptResponse:
         """Set custom system prompt. Empty string resets to default."""
         self.repo.set_system_prompt(
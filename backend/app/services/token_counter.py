@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
+import threading
+from collections import OrderedDict
+from functools import cache
 
 from app.providers.base import LLMProvider
 
@@ -17,15 +21,31 @@ _ENCODING_MAP = [
 ]
 _DEFAULT_ENCODING = "cl100k_base"
 
+# Per-message token counts keyed by (encoding, role, digest of serialized content).
+# Chat histories are mostly stable between turns, so only new/changed messages are
+# re-tokenized. The digest keeps keys small (image parts carry base64 data URLs).
+# Bounded LRU; guarded because OM background threads count too.
+_MESSAGE_TOKEN_CACHE: OrderedDict[tuple[str, str, bytes], int] = OrderedDict()
+_MESSAGE_TOKEN_CACHE_MAX = 4096
+_MESSAGE_TOKEN_CACHE_LOCK = threading.Lock()
+# Rough chat framing overhead per message.
+_MESSAGE_OVERHEAD = 4
+
+
+@cache
+def get_tiktoken_encoding(enc_name: str = _DEFAULT_ENCODING):
+    """Process-wide tiktoken encoding; raises if tiktoken is unavailable."""
+    import tiktoken
+
+    return tiktoken.get_encoding(enc_name)
+
 
 def count_text_tokens(text: str, model: str | None = None) -> int:
     """Estimate token count for plain text using tiktoken when available."""
     if not text:
         return 0
     try:
-        import tiktoken
-        enc_name = _encoding_for_model(model or "")
-        enc = tiktoken.get_encoding(enc_name)
+        enc = get_tiktoken_encoding(_encoding_for_model(model or ""))
         return len(enc.encode(text))
     except Exception:
         return max(1, len(text) // 4)
@@ -42,9 +62,7 @@ def extract_preview_by_tokens(
     if not text or preview_tokens <= 0:
         return text
     try:
-        import tiktoken
-        enc_name = _encoding_for_model(model or "")
-        enc = tiktoken.get_encoding(enc_name)
+        enc = get_tiktoken_encoding(_encoding_for_model(model or ""))
         token_ids = enc.encode(text)
         total = len(token_ids)
         if total <= preview_tokens * 2:
@@ -69,6 +87,38 @@ def _encoding_for_model(model: str) -> str:
     return _DEFAULT_ENCODING
 
 
+def _serialize_content(content) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return json.dumps(content)
+    if content is None:
+        return ""
+    return str(content)
+
+
+def _count_message_tokens(msg: dict, enc, enc_name: str) -> int:
+    """Token count for one message (framing + role + content), memoized by content."""
+    role = str(msg.get("role", ""))
+    raw = _serialize_content(msg.get("content", ""))
+    key = (enc_name, role, hashlib.blake2b(raw.encode(), digest_size=16).digest())
+    with _MESSAGE_TOKEN_CACHE_LOCK:
+        cached = _MESSAGE_TOKEN_CACHE.get(key)
+        if cached is not None:
+            _MESSAGE_TOKEN_CACHE.move_to_end(key)
+            return cached
+    count = _MESSAGE_OVERHEAD
+    if role:
+        count += len(enc.encode(role))
+    if raw:
+        count += len(enc.encode(raw))
+    with _MESSAGE_TOKEN_CACHE_LOCK:
+        _MESSAGE_TOKEN_CACHE[key] = count
+        if len(_MESSAGE_TOKEN_CACHE) > _MESSAGE_TOKEN_CACHE_MAX:
+            _MESSAGE_TOKEN_CACHE.popitem(last=False)
+    return count
+
+
 def count_messages_tokens(messages: list[dict], model: str | None = None) -> int:
     """Estimate token count for chat messages using tiktoken when available."""
     if not messages:
@@ -76,27 +126,11 @@ def count_messages_tokens(messages: list[dict], model: str | None = None) -> int
 
     # Try tiktoken first for better threshold fidelity.
     try:
-        import tiktoken
-
         enc_name = _encoding_for_model(model or "")
-        enc = tiktoken.get_encoding(enc_name)
+        enc = get_tiktoken_encoding(enc_name)
         total = 0
-        # Rough chat framing overhead per message + final assistant priming.
-        message_overhead = 4
         for msg in messages:
-            total += message_overhead
-            role = str(msg.get("role", ""))
-            if role:
-                total += len(enc.encode(role))
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                total += len(enc.encode(content)) if content else 0
-            elif isinstance(content, list):
-                raw = json.dumps(content)
-                total += len(enc.encode(raw)) if raw else 0
-            elif content is not None:
-                raw = str(content)
-                total += len(enc.encode(raw)) if raw else 0
+            total += _count_message_tokens(msg, enc, enc_name)
         total += 2
         return max(0, total)
     except Exception:
@@ -130,9 +164,7 @@ class TokenCounter:
     def _get_tiktoken_encoding(self):
         """Lazy-load tiktoken encoding."""
         if self._tiktoken_enc is None:
-            import tiktoken
-            enc_name = _encoding_for_model(self._model)
-            self._tiktoken_enc = tiktoken.get_encoding(enc_name)
+            self._tiktoken_enc = get_tiktoken_encoding(_encoding_for_model(self._model))
         return self._tiktoken_enc
 
     def count(self, text: str) -> int:
@@ -140,7 +140,11 @@ class ToolExecutor:
 
         if not is_parallel:
             self._create_tool_call_row(tc, chat_id, checkpoint_id, parallel_group)
-            self._chat_repo.commit()
+            # Auto-approved calls go straight to approve(), which marks the row
+            # running and commits on the same session: one commit covers both.
+            # Manual ones must be visible to the approval endpoint's session now.
+            if not auto_approved:
+                self._chat_repo.commit()
 
         if auto_approved:
             if is_parallel and self._session_factory:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -15,7 +16,7 @@ class ToolFileEdit:
 @dataclass
 class ToolResult:
     output: str
-    file_edits: list[ToolFileEdit]
+    file_edits: Sequence[ToolFileEdit]
     ok: bool = True
 
 
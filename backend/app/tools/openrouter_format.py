@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from weakref import WeakKeyDictionary
+
 from app.tools.contracts import Tool
 from app.tools.registry import get_tool_registry
 
+# Specs are built once per registered tool instance. Keyed weakly by the tool
+# object so registry resets / MCP re-registration naturally drop stale entries.
+_SPEC_CACHE: WeakKeyDictionary[Tool, dict] = WeakKeyDictionary()
+
 
 def tool_to_openrouter_spec(tool: Tool) -> dict:
     """
@@ -26,6 +32,15 @@ def tool_to_openrouter_spec(tool: Tool) -> dict:
     }
 
 
+def cached_openrouter_spec(tool: Tool) -> dict:
+    """Return the (shared, read-only) OpenRouter spec for a registered tool."""
+    spec = _SPEC_CACHE.get(tool)
+    if spec is None:
+        spec = tool_to_openrouter_spec(tool)
+        _SPEC_CACHE[tool] = spec
+    return spec
+
+
 def get_openrouter_tools(*, exclude_names: set[str] | None = None) -> list[dict]:
     """Return all registered tools in OpenRouter format, optionally excluding by name."""
     registry = get_tool_registry()
@@ -36,5 +51,5 @@ def get_openrouter_tools(*, exclude_names: set[str] | None = None) -> list[dict]
             continue
         tool = registry.get_tool(name)
         if tool:
-            tools.append(tool_to_openrouter_spec(tool))
+            tools.append(cached_openrouter_spec(tool))
     return tools
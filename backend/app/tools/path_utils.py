@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 # backend/app/tools/ -> backend/
@@ -50,7 +51,13 @@ _TRAILING_QUOTE_DELIMITER = re.compile(
 
 def sanitize_raw_path(raw_path: str) -> str:
     """Normalize path text from tool payloads before security checks."""
-    value = str(raw_path or "").strip()
+    return _sanitize_path_text(str(raw_path or "").strip())
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_path_text(value: str) -> str:
+    # Pure string work, so it is safe to memoize. Filesystem resolution and the
+    # blocked-prefix / project-root checks in resolve_path are never cached.
     if not value:
         return value
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import inspect
+from dataclasses import dataclass, replace
 
 from app.capabilities.tools.interfaces import ToolExecutionContext, ToolPlugin
 from app.capabilities.tools.loader import load_builtin_tool_plugins
-from app.core.container import get_container
+from app.core.container import get_container, set_container
 from app.tools.mcp_bridge import MCPBridgeTool
 from app.tools.contracts import Tool, ToolResult
 
@@ -37,7 +38,7 @@ class _PluginToolAdapter:
         tool_call_id: str | None = None,
         model_has_vision: bool = False,
     ) -> ToolResult:
-        result = await self._plugin.handler(
+        result = self._plugin.handler(
             payload,
             ToolExecutionContext(
                 project_root=project_root,
@@ -48,6 +49,8 @@ class _PluginToolAdapter:
                 model_has_vision=model_has_vision,
             ),
         )
+        if inspect.isawaitable(result):
+            result = await result
         output = result.output_preview if result.output_preview is not None else result.output
         if result.error and not output:
             output = result.error
@@ -130,5 +133,6 @@ def reset_tool_registry() -> None:
     container = get_container()
     if container is None:
         return
-    container.tool_registry = ToolRegistry()
-    container.tool_registry.register_builtin_plugins()
+    registry = ToolRegistry()
+    registry.register_builtin_plugins()
+    set_container(replace(container, tool_registry=registry))
@@ -14,7 +14,7 @@ def matches_auto_approve_rules(
     directory = os.path.dirname(path_value)
     payload_text = json.dumps(input_payload)
     for rule in rules:
-        if not bool(rule.enabled):
+        if not rule.enabled:
             continue
         if rule.field == "tool" and tool_name == rule.value:
             return True
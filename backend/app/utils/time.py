@@ -2,5 +2,9 @@ from datetime import datetime, timezone
 
 
 def utc_now_iso() -> str:
-    """Return current UTC time as ISO 8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+    """Return current UTC time as ISO 8601 string.
+
+    Microseconds are always emitted so stored timestamps have a fixed width and
+    compare correctly as strings.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
@@ -4,12 +4,13 @@ from collections.abc import Generator
 import pytest
 from fastapi.testclient import TestClient
 
-from app.config.settings import get_settings
+from app.config.settings import reset_settings
 from app.db.base import Base
 from app.db.models.chat import Chat
 from app.db.models.checkpoint import Checkpoint
 from app.db.models.message import Message
 from app.db.models.project import Project
+from app.db.repositories.settings_repo import reset_settings_cache
 from app.db.seed import seed_app_data
 from app.db.session import get_engine, reset_sessionmaker
 from app.main import create_app
@@ -41,7 +42,7 @@ def _seed_test_project_and_chat(session) -> None:
                 created_at=now,
                 updated_at=now,
                 sort_order=0,
-                is_pinned=0,
+                is_pinned=False,
             )
         )
     if session.get(Message, "msg-1") is None:
@@ -70,8 +71,10 @@ def _seed_test_project_and_chat(session) -> None:
 @pytest.fixture(scope="session", autouse=True)
 def test_env() -> None:
     os.environ["DATABASE_URL"] = "sqlite:///./test_agentic.db"
-    get_settings.cache_clear()
+    os.environ["ORM_RAISE_ON_LAZY_LOAD"] = "1"
+    reset_settings()
     reset_sessionmaker()
+    reset_settings_cache()
     engine = get_engine()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,18 @@
+import asyncio
+from dataclasses import replace
+
+from app.core.container import get_container, override_container
+
+
+def test_override_container_is_scoped_to_context(client):
+    base = get_container()
+    assert base is not None
+    override = replace(base, event_bus=object())
+
+    async def _read_in_task():
+        return get_container()
+
+    with override_container(override):
+        assert get_container() is override
+        assert asyncio.run(_read_in_task()) is override
+    assert get_container() is base
@@ -0,0 +1,55 @@
+import asyncio
+
+from app.capabilities.tools.interfaces import ToolExecutionContext
+from app.capabilities.tools.plugins.grep import (
+    _filter_ignored_paths,
+    _format_grouped_text,
+    _handler,
+    _required_literal,
+    _split_hit_line,
+)
+
+
+def test_split_hit_line_keeps_colons_in_content() -> None:
+    assert _split_hit_line("/tmp/app.py:12:def f(): pass") == ("/tmp/app.py", 12, "def f(): pass")
+    assert _split_hit_line("/tmp/app.py:3:needle:2:thing") == ("/tmp/app.py", 3, "needle:2:thing")
+
+
+def test_split_hit_line_skips_drive_letter_and_rejects_non_hits() -> None:
+    assert _split_hit_line(r"C:\work\app.py:7:x = 1") == (r"C:\work\app.py", 7, "x = 1")
+    assert _split_hit_line("/tmp/app.py") is None
+    assert _split_hit_line("a:b:c") is None
+
+
+def test_format_grouped_text_groups_by_path() -> None:
+    lines = ["/a.py:1:one", "/b.py:4:  four  ", "/a.py:9:nine"]
+
+    assert _format_grouped_text(lines) == "/a.py:\n  1: one\n  9: nine\n\n/b.py:\n  4: four"
+
+
+def test_filter_ignored_paths_matches_whole_dir_components() -> None:
+    lines = [
+        "/repo/node_modules/pkg/index.js:1:x",
+        r"C:\repo\.venv\lib\site.py:2:x",
+        "/repo/src/build.py:3:x",
+        "/repo/mycache/util.py:4:x",
+    ]
+
+    assert _filter_ignored_paths(lines) == ["/repo/src/build.py:3:x", "/repo/mycache/util.py:4:x"]
+
+
+def test_required_literal_only_returns_prefixes_every_match_contains() -> None:
+    assert _required_literal("def _han.ler") == "def _han"
+    assert _required_literal("^class Foo\\(") == "class Foo"
+    assert _required_literal("colou?r") == "colo"
+    assert _required_literal("needle") is None
+    assert _required_literal("foo|bar.*") is None
+    assert _required_literal("(?i)foo.bar") is None
+    assert _required_literal("ab.c") is None
+
+
+def test_grep_rejects_match_everything_patterns_before_searching() -> None:
+    result = asyncio.run(_handler({"pattern": ".*"}, ToolExecutionContext(project_root=None)))
+
+    assert result.ok is False
+    assert "matches every line" in result.output
@@ -38,16 +38,16 @@ def test_observation_skip_emits_terminal_status(monkeypatch) -> None:
         def __init__(self, _session) -> None:
             pass
 
-        def list_messages(self, _chat_id: str):
+        def iter_message_rows(self, _chat_id: str):
             return [SimpleNamespace(role="user", content="hello", id="msg-1", timestamp="2026-02-20T00:00:00+00:00")]
 
         def get_latest_observation(self, _chat_id: str):
             return None
 
-        def list_tool_calls(self, _chat_id: str):
+        def iter_tool_call_rows(self, _chat_id: str):
             return []
 
-        def list_reasoning_blocks(self, _chat_id: str):
+        def iter_reasoning_block_rows(self, _chat_id: str):
             return []
 
     class FakeSvc:
@@ -111,16 +111,16 @@ def test_reflector_none_still_emits_reflected(monkeypatch) -> None:
         def __init__(self, _session) -> None:
             pass
 
-        def list_messages(self, _chat_id: str):
+        def iter_message_rows(self, _chat_id: str):
             return [SimpleNamespace(role="user", content="hello", id="msg-1", timestamp="2026-02-20T00:00:00+00:00")]
 
         def get_latest_observation(self, _chat_id: str):
             return None
 
-        def list_tool_calls(self, _chat_id: str):
+        def iter_tool_call_rows(self, _chat_id: str):
             return []
 
-        def list_reasoning_blocks(self, _chat_id: str):
+        def iter_reasoning_block_rows(self, _chat_id: str):
             return []
 
     class FakeSvc:
@@ -206,13 +206,13 @@ def test_tool_activity_can_trigger_observer(monkeypatch) -> None:
         def __init__(self, _session) -> None:
             pass
 
-        def list_messages(self, _chat_id: str):
+        def iter_message_rows(self, _chat_id: str):
             return [SimpleNamespace(role="user", content="hi", id="msg-1", timestamp="2026-02-20T00:00:00+00:00")]
 
         def get_latest_observation(self, _chat_id: str):
             return None
 
-        def list_tool_calls(self, _chat_id: str):
+        def iter_tool_call_rows(self, _chat_id: str):
             return [
                 SimpleNamespace(
                     name="read_file",
@@ -222,7 +222,7 @@ def test_tool_activity_can_trigger_observer(monkeypatch) -> None:
                 )
             ]
 
-        def list_reasoning_blocks(self, _chat_id: str):
+        def iter_reasoning_block_rows(self, _chat_id: str):
             return []
 
     class FakeSvc:
@@ -313,16 +313,16 @@ def test_initial_information_counts_toward_observer_threshold(monkeypatch, tmp_p
         def __init__(self, _session) -> None:
             pass
 
-        def list_messages(self, _chat_id: str):
+        def iter_message_rows(self, _chat_id: str):
             return [SimpleNamespace(role="user", content="ok", id="msg-1", timestamp="2026-02-20T00:00:00+00:00")]
 
         def get_latest_observation(self, _chat_id: str):
             return None
 
-        def list_tool_calls(self, _chat_id: str):
+        def iter_tool_call_rows(self, _chat_id: str):
             return []
 
-        def list_reasoning_blocks(self, _chat_id: str):
+        def iter_reasoning_block_rows(self, _chat_id: str):
             return []
 
     class FakeSvc:
@@ -413,7 +413,7 @@ def test_activation_waits_for_threshold_even_with_buffered_chunks(monkeypatch) -
         def __init__(self, _session) -> None:
             pass
 
-        def list_messages(self, _chat_id: str):
+        def iter_message_rows(self, _chat_id: str):
             return [
                 SimpleNamespace(
                     role="user",
@@ -426,10 +426,10 @@ def test_activation_waits_for_threshold_even_with_buffered_chunks(monkeypatch) -
         def get_latest_observation(self, _chat_id: str):
             return None
 
-        def list_tool_calls(self, _chat_id: str):
+        def iter_tool_call_rows(self, _chat_id: str):
             return []
 
-        def list_reasoning_blocks(self, _chat_id: str):
+        def iter_reasoning_block_rows(self, _chat_id: str):
             return []
 
     class FakeSvc:
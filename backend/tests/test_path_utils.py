@@ -41,3 +41,15 @@ def test_sanitize_raw_path_keeps_single_trailing_brace_name(tmp_path: Path) -> N
 def test_resolve_path_still_rejects_relative_paths() -> None:
     with pytest.raises(ValueError, match="Path must be absolute"):
         resolve_path("src/main.py}},{", project_root="/tmp/project")
+
+
+def test_resolve_path_rechecks_symlink_swapped_after_first_resolve(tmp_path: Path) -> None:
+    target = tmp_path / "a.txt"
+    target.write_text("x = 1", encoding="utf-8")
+    assert resolve_path(str(target), project_root=str(tmp_path)) == target.resolve()
+
+    target.unlink()
+    target.symlink_to("/etc/hostname")
+
+    with pytest.raises(ValueError, match="restricted directory"):
+        resolve_path(str(target), project_root=str(tmp_path))
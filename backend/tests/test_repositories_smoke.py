@@ -1,6 +1,8 @@
+import json
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 
 from app.db.repositories.chat_repo import ChatRepository
 from app.db.repositories.project_repo import ProjectRepository
@@ -20,6 +22,38 @@ def test_project_repository_smoke() -> None:
         assert repo.get_message_count_for_chat(chats[0].id) >= 1
 
 
+def test_project_repository_batched_chat_listing_matches_per_chat_queries() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ProjectRepository(db)
+        project_ids = [p.id for p in repo.list_projects()]
+        chats_by_project = repo.list_chats_for_projects(project_ids)
+        for project_id in project_ids:
+            assert [c.id for c in chats_by_project[project_id]] == [
+                c.id for c in repo.list_chats_for_project(project_id)
+            ]
+        chats = [c for chats in chats_by_project.values() for c in chats]
+        summaries = repo.get_message_summaries_for_chats([c.id for c in chats])
+        for chat in chats:
+            last = repo.get_last_message_for_chat(chat.id)
+            expected = (last.content, repo.get_message_count_for_chat(chat.id)) if last else None
+            assert summaries.get(chat.id) == expected
+
+
+def test_project_repository_batched_id_lookup_skips_missing_ids() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ProjectRepository(db)
+        project = repo.list_projects()[0]
+        chat = repo.list_chats_for_project(project.id)[0]
+        assert repo.get_projects([project.id, "proj-missing"]) == {project.id: project}
+        assert repo.get_chats([chat.id, "chat-missing"]) == {chat.id: chat}
+        assert repo.get_chats([]) == {}
+        with pytest.raises(ValueError, match="Chat not found"):
+            repo.set_chat_order(project.id, [chat.id, "chat-missing"])
+        db.rollback()
+
+
 def test_settings_repository_smoke() -> None:
     session_factory = get_sessionmaker()
     with session_factory() as db:
@@ -30,6 +64,28 @@ def test_settings_repository_smoke() -> None:
         assert repo.list_models()
 
 
+def test_settings_cache_is_invalidated_by_writes() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        settings = SettingsRepository(db).get_settings()
+        assert settings is not None
+        original = settings.context_limit
+    with session_factory() as db:
+        repo = SettingsRepository(db)
+        repo.set_context_limit(original + 1)
+        repo.commit()
+    try:
+        with session_factory() as db:
+            settings = SettingsRepository(db).get_settings()
+            assert settings is not None
+            assert settings.context_limit == original + 1
+    finally:
+        with session_factory() as db:
+            repo = SettingsRepository(db)
+            repo.set_context_limit(original)
+            repo.commit()
+
+
 def test_chat_repository_smoke() -> None:
     session_factory = get_sessionmaker()
     with session_factory() as db:
@@ -40,6 +96,142 @@ def test_chat_repository_smoke() -> None:
         assert repo.list_checkpoints(chat.id)
 
 
+def test_lazy_relationship_load_raises_under_test_settings() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        chat = ChatRepository(db).get_chat("chat-1")
+        assert chat is not None
+        with pytest.raises(InvalidRequestError):
+            _ = chat.messages
+
+
+def test_chat_repository_row_readers_match_orm_lists() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ChatRepository(db)
+        messages = repo.list_messages("chat-1")
+        rows = repo.list_message_rows("chat-1")
+        assert [(r.id, r.role, r.content) for r in rows] == [
+            (m.id, m.role, m.content) for m in messages
+        ]
+        assert list(repo.iter_message_rows("chat-1")) == list(rows)
+        assert [r.id for r in repo.iter_tool_call_rows("chat-1")] == [
+            t.id for t in repo.list_tool_calls("chat-1")
+        ]
+
+
+def test_chat_repository_groups_attachments_by_message() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ChatRepository(db)
+        repo.create_message(
+            message_id="msg-att",
+            chat_id="chat-1",
+            role="user",
+            content="see images",
+            timestamp="2026-01-01T00:00:00Z",
+        )
+        for attachment_id, sort_order in (("att-b", 1), ("att-a", 0)):
+            repo.create_message_attachment(
+                attachment_id=attachment_id,
+                message_id="msg-att",
+                content_base64="AAAA",
+                mime_type="image/png",
+                sort_order=sort_order,
+            )
+        db.flush()
+
+        grouped = repo.list_attachments_for_chat("chat-1")
+        assert [a.id for a in grouped["msg-att"]] == [
+            a.id for a in repo.list_attachments_for_message("msg-att")
+        ] == ["att-a", "att-b"]
+        db.rollback()
+
+
+def test_take_file_snapshots_after_checkpoint_returns_newest_first_and_deletes() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ChatRepository(db)
+        repo.create_checkpoint(
+            checkpoint_id="cp-take",
+            chat_id="chat-1",
+            message_id="msg-take",
+            label="take",
+            timestamp="2099-01-01T00:00:00.000000+00:00",
+        )
+        for snapshot_id, timestamp in (
+            ("snap-old", "2099-01-01T00:00:01.000000+00:00"),
+            ("snap-new", "2099-01-01T00:00:02.000000+00:00"),
+        ):
+            repo.create_file_snapshot(
+                snapshot_id=snapshot_id,
+                chat_id="chat-1",
+                checkpoint_id="cp-take",
+                file_edit_id=None,
+                file_path=f"/tmp/{snapshot_id}",
+                content=None,
+                timestamp=timestamp,
+            )
+        db.flush()
+
+        taken = repo.take_file_snapshots_after_checkpoint(
+            "chat-1", "2099-01-01T00:00:00.000000+00:00", "cp-take"
+        )
+        assert [row.file_path for row in taken] == ["/tmp/snap-new", "/tmp/snap-old"]
+        assert repo.take_file_snapshots_after_checkpoint(
+            "chat-1", "2099-01-01T00:00:00.000000+00:00", "cp-take"
+        ) == []
+        db.rollback()
+
+
+def test_observational_memory_revert_keeps_only_observations_with_live_messages() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ChatRepository(db)
+        live_message_id = repo.list_messages("chat-1")[0].id
+        for observation_id, generation, up_to, timestamp in (
+            ("obs-live", 1, live_message_id, "2026-01-01T00:00:00.000000+00:00"),
+            ("obs-gone", 2, "msg-deleted", "2026-01-01T00:00:01.000000+00:00"),
+            ("obs-late", 3, live_message_id, "2099-01-01T00:00:00.000000+00:00"),
+        ):
+            repo.create_observation(
+                observation_id=observation_id,
+                chat_id="chat-1",
+                generation=generation,
+                content=f"content of {observation_id}",
+                token_count=10,
+                observed_up_to_message_id=up_to,
+                current_task=None,
+                suggested_response=None,
+                timestamp=timestamp,
+            )
+        repo.set_memory_state(
+            chat_id="chat-1",
+            strategy="observational",
+            state_json={
+                "buffer": {
+                    "chunks": [
+                        {"content": "kept", "tokenCount": 5, "observedUpToMessageId": live_message_id},
+                        {"content": "dropped", "tokenCount": 5, "observedUpToMessageId": "msg-deleted"},
+                    ]
+                }
+            },
+            updated_at="2026-01-01T00:00:00.000000+00:00",
+        )
+        db.flush()
+
+        repo._revert_observational_memory_after_timestamp(
+            chat_id="chat-1", cutoff_ts="2026-06-01T00:00:00.000000+00:00"
+        )
+
+        assert [o.id for o in repo.list_observations("chat-1")] == ["obs-live"]
+        state = repo.get_memory_state("chat-1")
+        assert state is not None
+        assert state.state_json["content"] == "content of obs-live"
+        assert [c["content"] for c in state.state_json["buffer"]["chunks"]] == ["kept"]
+        db.rollback()
+
+
 def test_api_key_resolver_db_first_env_fallback() -> None:
     """APIKeyResolver uses DB first, then env fallback."""
     session_factory = get_sessionmaker()
@@ -67,3 +259,25 @@ def test_api_key_resolver_resolve_or_raise_when_no_key(monkeypatch: pytest.Monke
             resolver = APIKeyResolver(repo)
             with pytest.raises(ValueError, match="No openrouter API key"):
                 resolver.resolve_or_raise()
+
+
+def test_count_incomplete_todos_uses_latest_todo_update() -> None:
+    session_factory = get_sessionmaker()
+    with session_factory() as db:
+        repo = ChatRepository(db)
+        assert repo.count_incomplete_todos("chat-1") == 0
+        for idx, statuses in enumerate((["pending", "completed"], ["completed", "COMPLETED"])):
+            repo.create_tool_call(
+                tool_call_id=f"tc-todo-count-{idx}",
+                chat_id="chat-1",
+                checkpoint_id=None,
+                name="update_todo_list",
+                status="completed",
+                input_json=json.dumps(
+                    {"todos": [{"content": f"item {n}", "status": s} for n, s in enumerate(statuses)]}
+                ),
+                timestamp=f"2020-01-01T00:00:0{idx}Z",
+            )
+            db.flush()
+            assert repo.count_incomplete_todos("chat-1") == (1 if idx == 0 else 0)
+        db.rollback()
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from pathlib import Path
 
 import httpx
@@ -387,8 +386,6 @@ def test_revert_removes_plans_created_after_checkpoint(client) -> None:
         repo.create_project_plan_revision(
             revision_id="prv-plan-keep-r1",
             plan_id=keep_plan_id,
-            chat_id="chat-1",
-            project_id=chat.project_id,
             checkpoint_id=keep_checkpoint.id,
             revision=1,
             title="Keep Plan",
@@ -420,8 +417,6 @@ def test_revert_removes_plans_created_after_checkpoint(client) -> None:
         repo.create_project_plan_revision(
             revision_id="prv-plan-drop-r1",
             plan_id=drop_plan_id,
-            chat_id="chat-1",
-            project_id=chat.project_id,
             checkpoint_id=drop_checkpoint.id,
             revision=1,
             title="Drop Plan",
@@ -521,8 +516,6 @@ def test_revert_restores_plan_revision_state(client) -> None:
         repo.create_project_plan_revision(
             revision_id="prv-plan-restore-r1",
             plan_id=plan_id,
-            chat_id="chat-1",
-            project_id=chat.project_id,
             checkpoint_id=keep_checkpoint.id,
             revision=1,
             title="Plan V1",
@@ -538,8 +531,6 @@ def test_revert_restores_plan_revision_state(client) -> None:
         repo.create_project_plan_revision(
             revision_id="prv-plan-restore-r2",
             plan_id=plan_id,
-            chat_id="chat-1",
-            project_id=chat.project_id,
             checkpoint_id=later_checkpoint.id,
             revision=2,
             title="Plan V2",
@@ -662,37 +653,35 @@ def test_revert_prunes_observational_memory_to_checkpoint(client) -> None:
         repo.set_memory_state(
             chat_id="chat-1",
             strategy="observational",
-            state_json=json.dumps(
-                {
-                    "generation": 1,
-                    "tokenCount": 3,
-                    "observedUpToMessageId": drop_message.id,
-                    "currentTask": "drop task",
-                    "suggestedResponse": "drop suggestion",
-                    "timestamp": later_ts,
-                    "content": "drop observation",
-                    "buffer": {
-                        "tokens": 1024,
-                        "lastBoundary": 4,
-                        "upToMessageId": drop_message.id,
-                        "upToTimestamp": later_ts,
-                        "chunks": [
-                            {
-                                "content": "keep chunk",
-                                "tokenCount": 2,
-                                "observedUpToMessageId": keep_message.id,
-                                "observedUpToTimestamp": base_ts,
-                            },
-                            {
-                                "content": "drop chunk",
-                                "tokenCount": 2,
-                                "observedUpToMessageId": drop_message.id,
-                                "observedUpToTimestamp": later_ts,
-                            },
-                        ],
-                    },
-                }
-            ),
+            state_json={
+                "generation": 1,
+                "tokenCount": 3,
+                "observedUpToMessageId": drop_message.id,
+                "currentTask": "drop task",
+                "suggestedResponse": "drop suggestion",
+                "timestamp": later_ts,
+                "content": "drop observation",
+                "buffer": {
+                    "tokens": 1024,
+                    "lastBoundary": 4,
+                    "upToMessageId": drop_message.id,
+                    "upToTimestamp": later_ts,
+                    "chunks": [
+                        {
+                            "content": "keep chunk",
+                            "tokenCount": 2,
+                            "observedUpToMessageId": keep_message.id,
+                            "observedUpToTimestamp": base_ts,
+                        },
+                        {
+                            "content": "drop chunk",
+                            "tokenCount": 2,
+                            "observedUpToMessageId": drop_message.id,
+                            "observedUpToTimestamp": later_ts,
+                        },
+                    ],
+                },
+            },
             updated_at=later_ts,
         )
         db.commit()
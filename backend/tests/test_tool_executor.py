@@ -64,3 +64,33 @@ def test_execute_tool_calls_parallelism_is_bounded() -> None:
     assert peak <= 4
     assert repo.created_tool_calls == 20
     assert repo.commits == 1
+
+
+class _RecordingApprovalService(_DummyApprovalService):
+    def __init__(self, repo: _DummyChatRepo) -> None:
+        self.repo = repo
+        self.commits_before_approve: int | None = None
+
+    async def approve(self, *, chat_id: str, tool_call_id: str):
+        self.commits_before_approve = self.repo.commits
+        return types.SimpleNamespace(output="ok"), []
+
+
+def test_sequential_auto_approved_call_defers_commit_to_approve() -> None:
+    repo = _DummyChatRepo()
+    approval = _RecordingApprovalService(repo)
+    executor = ToolExecutor(repo, approval, _DummyEventBus())
+
+    results = asyncio.run(
+        executor.execute_tool_calls(
+            tool_calls_from_stream=[
+                {"id": "call-1", "function": {"name": "read_file", "arguments": "{}"}}
+            ],
+            chat_id="chat-1",
+            checkpoint_id="cp-1",
+        )
+    )
+
+    assert results
+    assert repo.created_tool_calls == 1
+    assert approval.commits_before_approve == 0